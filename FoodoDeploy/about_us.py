@@ -1,87 +1,35 @@
 import streamlit as st
 import os
-import base64
-
-# ✅ Function to Convert Image to Base64
-def get_base64_image(image_path):
-    """Encodes an image in Base64 format for embedding in HTML."""
-    if not os.path.exists(image_path):
-        return None  # Return None if image is missing
-    
-    with open(image_path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-# ✅ Function to Set a Background Image
-def set_background(image_file):
-    """Sets a background image in Streamlit using custom CSS."""
-    encoded_string = get_base64_image(image_file)
-    if encoded_string:
-        page_bg_css = f"""
-        <style>
-        .stApp {{
-            background-image: url("data:image/jpeg;base64,{encoded_string}");
-            background-size: cover;
-            background-position: center;
-            background-attachment: fixed;
-        }}
-        </style>
-        """
-        st.markdown(page_bg_css, unsafe_allow_html=True)
+from assets import picture_html
 
 # ✅ Function to Display Header with Logo for About Us
 def about_us_header():
     """Displays the About Us logo in the header."""
     logo_path = os.path.join("images", "aboutuslogo.jpg")  # Ensure correct path
-    logo_base64 = get_base64_image(logo_path)
+    logo_html = picture_html(logo_path, "logo", "About Us Logo")
 
-    if logo_base64:
+    if logo_html:
         st.markdown(f"""
-            <style>
-                .about-header {{
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 15px;
-                    background-color: rgb(5, 1, 1);
-                    padding: 15px;
-                    border-radius: 10px;
-                    box-shadow: 0px 2px 5px rgba(252, 252, 252, 0.86);
-                }}
-                .about-header img {{
-                    height: 60px;
-                    width: auto;
-                    border-radius: 5px;
-                }}
-                .about-header h1 {{
-                    color: white;
-                    font-size: 26px;
-                    font-weight: bold;
-                    margin: 0;
-                }}
-            </style>
-            <div class="about-header">
-                <img src="data:image/jpeg;base64,{logo_base64}" alt="About Us Logo">
+            <div class="page-header">
+                {logo_html}
                 <h1>About Us - Food Flow</h1>
             </div>
         """, unsafe_allow_html=True)
     else:
         st.title("📌 About Us - Food Flow")  # Fallback if logo is missing
 
-# ✅ Load Team Member Images
+# ✅ Team Member Images (drawn through the "team" slot variants)
 team_images = {
-    "Rizwan Yousaf": get_base64_image("images/istructor.jpg"),
-    "Zaib Un Nisa": get_base64_image("images/zaib.jpg"),
-    "Rao Muhammad Zubair": get_base64_image("images/zubair.jpg"),
-    "Huzaifa Jahangir": get_base64_image("images/huzaifa.jpg"),
-    "Jannat Chochan": get_base64_image("images/jannat.jpg"),
-    "Farhan Ashraf": get_base64_image("images/farhan.jpg"),
+    "Rizwan Yousaf": "images/istructor.jpg",
+    "Zaib Un Nisa": "images/zaib.jpg",
+    "Rao Muhammad Zubair": "images/zubair.jpg",
+    "Huzaifa Jahangir": "images/huzaifa.jpg",
+    "Jannat Chochan": "images/jannat.jpg",
+    "Farhan Ashraf": "images/farhan.jpg",
 }
 
 # ✅ About Us Page Function
 def about_us_page():
-    # ✅ Set Background Image
-    set_background("images/flas.jpg")
-
     # ✅ Display About Us Header with Logo
     about_us_header()
     st.markdown("")
@@ -123,58 +71,8 @@ def about_us_page():
 
     # Team Members Section
     st.markdown("## 🌟 Our Dedicated Team") 
-    st.markdown("<style>.fade-in {{ animation: fadeIn 1s; }}</style>", unsafe_allow_html=True)  # Motion UI effect 
     st.markdown("<div class='fade-in'>", unsafe_allow_html=True)  # Start fade-in effect
 
-    
-    # Improved CSS for Proper Image Display and Vertical Spacing
-    st.markdown("""
-        <style>
-        .team-container {
-            display: flex;
-            flex-wrap: wrap;
-            justify-content: center;
-            gap: 50px;  /* Increased spacing between cards */
-            padding: 20px;
-        }
-        .team-card {
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            background: rgba(255, 255, 255, 0.85);
-            padding: 25px;  /* Increased padding */
-            border-radius: 10px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            width: 300px;
-            text-align: center;
-            margin-bottom: 30px;  /* More vertical spacing */
-            transition: transform 0.3s; /* Animation for card */
-        }
-        .team-card:hover {
-            transform: scale(1.05); /* Slightly increase size on hover */
-            box-shadow: 0 8px 16px rgba(0,0,0,0.4); /* Enhanced shadow on hover */
-        }
-        .team-card img {
-            width: 150px;  /* Bigger images */
-            height: 150px;
-            border-radius: 50%;
-            object-fit: cover;  /* Ensures the full image is displayed */
-            margin-bottom: 20px; /* Increased spacing */
-            border: 3px solid white;
-        }
-        .team-card h3 {
-            font-size: 20px;
-            color: #333;
-            margin: 8px 0;
-        }
-        .team-card p {
-            font-size: 15px;
-            color: #555;
-            margin: 5px 0;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-
     st.markdown('<div class="team-container">', unsafe_allow_html=True)
 
     members = [
@@ -189,12 +87,12 @@ def about_us_page():
     # Display members in rows with proper spacing
     cols = st.columns(3)
     for index, (name, role, email) in enumerate(members):
-        img_src = f"data:image/jpeg;base64,{team_images[name]}" if team_images[name] else "https://via.placeholder.com/140"
+        img_html = picture_html(team_images[name], "team", name) or f'<img src="https://via.placeholder.com/140" alt="{name}">'
 
         with cols[index % 3]:  
             st.markdown(f"""
                 <div class="team-card">
-                    <img src="{img_src}" alt="{name}">
+                    {img_html}
                     <h3>{name}</h3>
                     <p><strong>{role}</strong></p>
                     <p>{email}</p>
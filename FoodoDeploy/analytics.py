@@ -0,0 +1,124 @@
+import time
+from typing import NamedTuple
+
+HOUR, DAY = 3600, 86400
+
+# ✅ Dashboard windows: label -> (rollup, bucket seconds, buckets). Each window reads at most
+#    that many rows per vendor, however long the vendor's order history is.
+WINDOWS = {
+    "Last 24 hours": ("vendor_sales_hourly", HOUR, 24),
+    "Last 7 days": ("vendor_sales_daily", DAY, 7),
+    "Last 30 days": ("vendor_sales_daily", DAY, 30),
+}
+TOP_ITEMS = 5
+
+# ✅ Rollup upserts - run by the order writer inside each order's transaction
+UPSERT_HOURLY = """
+    INSERT INTO vendor_sales_hourly (vendor_id, hour, orders, units, revenue_cents) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (vendor_id, hour) DO UPDATE SET
+        orders = orders + excluded.orders,
+        units = units + excluded.units,
+        revenue_cents = revenue_cents + excluded.revenue_cents
+"""
+UPSERT_DAILY = """
+    INSERT INTO vendor_sales_daily (vendor_id, day, orders, units, revenue_cents) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (vendor_id, day) DO UPDATE SET
+        orders = orders + excluded.orders,
+        units = units + excluded.units,
+        revenue_cents = revenue_cents + excluded.revenue_cents
+"""
+UPSERT_ITEM_HOURLY = """
+    INSERT INTO vendor_item_sales_hourly (vendor_id, hour, item_id, name, units, revenue_cents) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (vendor_id, hour, item_id) DO UPDATE SET
+        name = excluded.name,
+        units = units + excluded.units,
+        revenue_cents = revenue_cents + excluded.revenue_cents
+"""
+UPSERT_ITEM_DAILY = """
+    INSERT INTO vendor_item_sales_daily (vendor_id, day, item_id, name, units, revenue_cents) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (vendor_id, day, item_id) DO UPDATE SET
+        name = excluded.name,
+        units = units + excluded.units,
+        revenue_cents = revenue_cents + excluded.revenue_cents
+"""
+
+# ✅ Dashboard reads - primary key range seeks (checked by `python migrations.py --check`)
+HOURLY_SALES = (
+    "SELECT hour, orders, units, revenue_cents FROM vendor_sales_hourly WHERE vendor_id=? AND hour>=? ORDER BY hour"
+)
+DAILY_SALES = (
+    "SELECT day, orders, units, revenue_cents FROM vendor_sales_daily WHERE vendor_id=? AND day>=? ORDER BY day"
+)
+TOP_SELLERS_HOURLY = (
+    "SELECT item_id, MAX(name), SUM(units), SUM(revenue_cents) FROM vendor_item_sales_hourly"
+    " WHERE vendor_id=? AND hour>=? GROUP BY item_id ORDER BY 4 DESC, 3 DESC LIMIT ?"
+)
+TOP_SELLERS = (
+    "SELECT item_id, MAX(name), SUM(units), SUM(revenue_cents) FROM vendor_item_sales_daily"
+    " WHERE vendor_id=? AND day>=? GROUP BY item_id ORDER BY 4 DESC, 3 DESC LIMIT ?"
+)
+SALES_QUERIES = {"vendor_sales_hourly": HOURLY_SALES, "vendor_sales_daily": DAILY_SALES}
+TOP_SELLERS_QUERIES = {"vendor_sales_hourly": TOP_SELLERS_HOURLY, "vendor_sales_daily": TOP_SELLERS}
+
+
+class SalesBucket(NamedTuple):
+    start: int  # Unix time the hour / day begins (UTC)
+    orders: int
+    units: int
+    revenue_cents: int
+
+
+class TopItem(NamedTuple):
+    item_id: str
+    name: str
+    units: int
+    revenue_cents: int
+
+
+def record_sales(conn, lines, placed_at):
+    """Adds one order's lines (OrderLine, ...) to the rollups. Call inside the order's transaction."""
+    hour = int(placed_at // HOUR) * HOUR
+    day = int(placed_at // DAY) * DAY
+    vendors, items = {}, {}
+    for line in lines:
+        units, cents = line.quantity, line.quantity * line.unit_cents
+        total = vendors.setdefault(line.vendor_id, [0, 0])
+        total[0] += units
+        total[1] += cents
+        item = items.setdefault((line.vendor_id, line.item_id), [line.name, 0, 0])
+        item[1] += units
+        item[2] += cents
+    conn.executemany(UPSERT_HOURLY, [(vendor_id, hour, 1, *total) for vendor_id, total in vendors.items()])
+    conn.executemany(UPSERT_DAILY, [(vendor_id, day, 1, *total) for vendor_id, total in vendors.items()])
+    conn.executemany(UPSERT_ITEM_HOURLY, [(vendor_id, hour, item_id, *item) for (vendor_id, item_id), item in items.items()])
+    conn.executemany(UPSERT_ITEM_DAILY, [(vendor_id, day, item_id, *item) for (vendor_id, item_id), item in items.items()])
+
+
+def window_start(window, now=None):
+    _, seconds, buckets = WINDOWS[window]
+    now = time.time() if now is None else now
+    return (int(now // seconds) - buckets + 1) * seconds
+
+
+def sales_series(conn, vendor_id, window, now=None):
+    """One SalesBucket per hour / day of the window, oldest first (zeros where nothing sold)."""
+    table, seconds, buckets = WINDOWS[window]
+    start = window_start(window, now)
+    rows = {row[0]: row for row in conn.execute(SALES_QUERIES[table], (vendor_id, start))}
+    return [
+        SalesBucket(*rows.get(bucket, (bucket, 0, 0, 0)))
+        for bucket in range(start, start + buckets * seconds, seconds)
+    ]
+
+
+def sales_totals(series):
+    """(orders, units, revenue_cents) over a series."""
+    return (sum(bucket.orders for bucket in series), sum(bucket.units for bucket in series),
+            sum(bucket.revenue_cents for bucket in series))
+
+
+def top_items(conn, vendor_id, window, limit=TOP_ITEMS, now=None):
+    """A vendor's best sellers by revenue over a window - the same buckets sales_series() reads."""
+    table = WINDOWS[window][0]
+    start = window_start(window, now)
+    return [TopItem(*row) for row in conn.execute(TOP_SELLERS_QUERIES[table], (vendor_id, start, limit))]
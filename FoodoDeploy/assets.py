@@ -0,0 +1,296 @@
+import os
+import base64
+import hashlib
+import json
+import mimetypes
+import tempfile
+import threading
+from collections import OrderedDict
+
+# ✅ All page images live next to this file, whatever the working directory is
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(BASE_DIR, "images")
+
+# ✅ Resized per-slot variants written by build_images.py
+DERIVED_MANIFEST_PATH = os.path.join(IMAGES_DIR, "derived", "manifest.json")
+
+# ✅ Streamlit serves ./static at app/static/ when server.enableStaticServing is on
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+STATIC_IMAGES_DIR = os.path.join(STATIC_DIR, "img")
+STATIC_URL = "app/static"
+
+# ✅ Cache limits - the whole images folder fits comfortably, a runaway one does not
+MAX_CACHE_ENTRIES = 64
+MAX_CACHE_BYTES = 8 * 1024 * 1024
+
+
+def resolve_image_path(image_path):
+    """Turns 'images/x.jpg' (or an absolute path) into an absolute path under the app folder."""
+    if os.path.isabs(image_path):
+        return image_path
+    return os.path.join(BASE_DIR, image_path)
+
+
+class ImageCache:
+    """Thread-safe LRU of base64-encoded files, keyed by path + mtime + size and capped by bytes."""
+
+    def __init__(self, max_entries=MAX_CACHE_ENTRIES, max_bytes=MAX_CACHE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (path, mtime_ns, size) -> base64 string
+        self._current_key = {}  # path -> key of the version we hold
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, image_path):
+        """Returns the base64 text for a file, or None if the file is missing."""
+        path = resolve_image_path(image_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            encoded = self._entries.get(key)
+            if encoded is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return encoded
+            self.misses += 1
+
+        # Read and encode outside the lock so a cold file does not stall other sessions
+        with open(path, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode()
+
+        with self._lock:
+            stale_key = self._current_key.get(path)
+            if stale_key is not None and stale_key != key:
+                self._discard(stale_key)
+            if key not in self._entries:
+                self._entries[key] = encoded
+                self._current_key[path] = key
+                self._bytes += len(encoded)
+                self._evict()
+        return encoded
+
+    def _discard(self, key):
+        encoded = self._entries.pop(key, None)
+        if encoded is not None:
+            self._bytes -= len(encoded)
+            if self._current_key.get(key[0]) == key:
+                del self._current_key[key[0]]
+
+    def _evict(self):
+        # Always keep the newest entry, even if it alone is over the byte budget
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._entries))
+            self._discard(oldest_key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_key.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Returns hit/miss counters and current size for monitoring."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+# ✅ One cache per process, shared by every page and every session
+_image_cache = ImageCache()
+
+
+def get_base64_image(image_path):
+    """Encodes an image in Base64 format for embedding in HTML (cached per process)."""
+    return _image_cache.get(image_path)
+
+
+def image_cache_stats():
+    """Returns the shared image cache counters."""
+    return _image_cache.stats()
+
+
+def content_hash(data, length=10):
+    """Short hex digest used to fingerprint published file names."""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def static_serving_enabled():
+    """True when Streamlit is configured to serve the ./static folder."""
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+class StaticPublisher:
+    """Copies images into static/img/ under content-hashed names and hands out their URLs."""
+
+    def __init__(self, target_dir=STATIC_IMAGES_DIR, url_prefix=STATIC_URL + "/img"):
+        self.target_dir = target_dir
+        self.url_prefix = url_prefix
+        self._published = {}  # path -> ((mtime_ns, size), url)
+        self._lock = threading.Lock()
+
+    def url_for(self, image_path):
+        """Returns the hashed URL for an image, publishing it on first use. None if missing."""
+        path = resolve_image_path(image_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._published.get(path)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        with self._lock:
+            entry = self._published.get(path)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            with open(path, "rb") as f:
+                data = f.read()
+            stem, ext = os.path.splitext(os.path.basename(path))
+            url = self.publish(stem, ext.lower(), data)
+            self._published[path] = (version, url)
+            return url
+
+    def publish(self, stem, ext, data):
+        """Writes generated bytes as stem.<hash>ext (once) and returns their URL."""
+        hashed_name = f"{stem}.{content_hash(data)}{ext}"
+        self._write(hashed_name, data)
+        return f"{self.url_prefix}/{hashed_name}"
+
+    def _write(self, hashed_name, data):
+        target = os.path.join(self.target_dir, hashed_name)
+        if os.path.exists(target):
+            return  # Same name means same bytes - nothing to do
+        os.makedirs(self.target_dir, exist_ok=True)
+        # Write then rename so a browser never fetches a half-written file
+        fd, tmp_path = tempfile.mkstemp(dir=self.target_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, target)
+
+    def publish_all(self, source_dir=IMAGES_DIR):
+        """Publishes every image in a folder up front. Returns {file name: url}."""
+        manifest = {}
+        for name in sorted(os.listdir(source_dir)):
+            mime, _ = mimetypes.guess_type(name)
+            if mime and mime.startswith("image/"):
+                manifest[name] = self.url_for(os.path.join(source_dir, name))
+        return manifest
+
+
+_publisher = StaticPublisher()
+
+
+def data_uri(image_path):
+    """Inline data: URI for an image, or None if it is missing."""
+    encoded = get_base64_image(image_path)
+    if encoded is None:
+        return None
+    mime, _ = mimetypes.guess_type(resolve_image_path(image_path))
+    return f"data:{mime or 'image/jpeg'};base64,{encoded}"
+
+
+def image_url(image_path):
+    """URL to use in <img src> / CSS url(): a cacheable static URL, or a data URI fallback."""
+    if static_serving_enabled():
+        try:
+            url = _publisher.url_for(image_path)
+        except OSError:
+            url = None  # Read-only deploy - fall back to inlining
+        if url is not None:
+            return url
+    return data_uri(image_path)
+
+
+def publish_static_assets():
+    """Publishes the whole images folder (used at startup and by deploy scripts)."""
+    return _publisher.publish_all()
+
+
+_manifest = {"version": None, "variants": {}}
+_manifest_lock = threading.Lock()
+
+
+def derived_variants():
+    """Returns the build_images.py manifest ({image: {slot: entry}}), reloaded when it changes."""
+    try:
+        stat = os.stat(DERIVED_MANIFEST_PATH)
+    except OSError:
+        return {}  # No build has run - pages use the originals
+    version = (stat.st_mtime_ns, stat.st_size)
+    if _manifest["version"] != version:
+        with _manifest_lock:
+            if _manifest["version"] != version:
+                with open(DERIVED_MANIFEST_PATH, encoding="utf-8") as f:
+                    _manifest["variants"] = json.load(f).get("variants", {})
+                _manifest["version"] = version
+    return _manifest["variants"]
+
+
+def slot_image_urls(image_path, slot):
+    """Returns (webp_url, fallback_url) for an image drawn in a display slot.
+
+    Falls back to the original file when no derivative exists. webp_url is None
+    when there is no WebP variant, or when images are being inlined as data URIs
+    (sending both formats inline would double the payload).
+    """
+    path = resolve_image_path(image_path)
+    entry = derived_variants().get(os.path.basename(path), {}).get(slot)
+    if entry is None:
+        return None, image_url(path)
+
+    fallback_url = image_url(os.path.join(IMAGES_DIR, entry["fallback"]["file"]))
+    if fallback_url is None:
+        return None, image_url(path)  # Manifest out of date with the files on disk
+    webp_url = None
+    if "webp" in entry and static_serving_enabled():
+        webp_url = image_url(os.path.join(IMAGES_DIR, entry["webp"]["file"]))
+    return webp_url, fallback_url
+
+
+def css_background_image(image_path, slot):
+    """CSS background-image declarations preferring WebP, or "" if the image is missing."""
+    webp_url, fallback_url = slot_image_urls(image_path, slot)
+    if fallback_url is None:
+        return ""
+    css = f'background-image: url("{fallback_url}");'
+    if webp_url:
+        css += (f' background-image: image-set(url("{webp_url}") type("image/webp"),'
+                f' url("{fallback_url}"));')
+    return css
+
+
+def picture_html(image_path, slot, alt):
+    """<picture> markup preferring WebP, or None if the image is missing."""
+    webp_url, fallback_url = slot_image_urls(image_path, slot)
+    if fallback_url is None:
+        return None
+    img = f'<img src="{fallback_url}" alt="{alt}">'
+    if webp_url is None:
+        return img
+    return f'<picture><source srcset="{webp_url}" type="image/webp">{img}</picture>'
+
+
+if __name__ == "__main__":
+    for name, url in publish_static_assets().items():
+        print(f"{name} -> {url}")
@@ -0,0 +1,135 @@
+import os
+import hmac
+import time
+import base64
+import hashlib
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+ALGORITHM = "pbkdf2_sha256"
+ITERATIONS = 600_000  # OWASP's current recommendation for PBKDF2-HMAC-SHA256 (~0.3s of CPU)
+SALT_BYTES = 16
+HASH_WORKERS = max(1, min(4, os.cpu_count() or 1))  # Hashes running at once
+MAX_PENDING = 64  # Logins queued or running before new ones are turned away
+PENDING_TIMEOUT = 5  # Seconds a login waits for a queue slot
+TOKEN_TTL = 8 * 60 * 60  # Seconds a vendor stays logged in
+
+# ✅ Signs session tokens. Set FOODFLOW_SECRET_KEY to keep tokens valid across restarts
+#    and processes; otherwise every process gets its own random key.
+SECRET_KEY = os.environ.get("FOODFLOW_SECRET_KEY", "").encode() or secrets.token_bytes(32)
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _unb64(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+# ✅ Password hashing - CPU-heavy, so call these through PasswordHasher from page code
+
+def hash_password(password, iterations=ITERATIONS):
+    """A salted PBKDF2 hash in the form pbkdf2_sha256$iterations$salt$hash."""
+    salt = secrets.token_bytes(SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{ALGORITHM}${iterations}${_b64(salt)}${_b64(digest)}"
+
+
+def verify_password(password, stored):
+    """(matches, needs_rehash) for a password against a stored value.
+
+    Values without the hash prefix are plaintext passwords from before hashing
+    was introduced; they still verify, but ask to be rehashed. So do hashes
+    made with fewer iterations than ITERATIONS. A malformed hash never matches.
+    """
+    if not stored.startswith(ALGORITHM + "$"):
+        return hmac.compare_digest(password.encode(), stored.encode()), True
+    try:
+        _, iterations, salt, digest = stored.split("$")
+        iterations, salt, digest = int(iterations), _unb64(salt), _unb64(digest)
+    except ValueError:  # Wrong field count, bad iteration count or bad base64 (binascii.Error)
+        return False, False
+    if iterations < 1:
+        return False, False
+    candidate = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return hmac.compare_digest(candidate, digest), iterations < ITERATIONS
+
+
+class PasswordHasher:
+    """Runs password hashing on a small, bounded thread pool.
+
+    hashlib releases the GIL while it hashes, so a slow login only occupies a
+    pool worker, and other sessions' scripts keep running. At most
+    HASH_WORKERS hashes run at once. Past MAX_PENDING queued logins, new ones
+    wait up to PENDING_TIMEOUT for a slot and then get a TimeoutError, so a
+    burst of attempts cannot pile up unbounded work.
+    """
+
+    def __init__(self, workers=HASH_WORKERS, max_pending=MAX_PENDING):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._dummy_hash = None
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(timeout=PENDING_TIMEOUT):
+            raise TimeoutError("Too many logins in progress")
+        try:
+            return self._pool.submit(fn, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password):
+        return self._run(hash_password, password)
+
+    def verify(self, password, stored):
+        """(matches, needs_rehash). Pass stored=None for an unknown user - it costs the same as a real check."""
+        if stored is None:
+            if self._dummy_hash is None:
+                self._dummy_hash = self._run(hash_password, secrets.token_hex(8))
+            self._run(verify_password, password, self._dummy_hash)
+            return False, False
+        return self._run(verify_password, password, stored)
+
+    def shutdown(self):
+        self._pool.shutdown()
+
+
+# ✅ One hasher (and thread pool) per process
+@st.cache_resource
+def get_password_hasher():
+    return PasswordHasher()
+
+
+# ✅ Session tokens - "vendor_id|username|expires" plus an HMAC, checked without the database
+
+def issue_token(vendor_id, username, now=None):
+    expires = int((time.time() if now is None else now) + TOKEN_TTL)
+    payload = f"{vendor_id}|{username}|{expires}".encode()
+    signature = hmac.new(SECRET_KEY, payload, hashlib.sha256).digest()
+    return f"{_b64(payload)}.{_b64(signature)}"
+
+
+def read_token(token, now=None):
+    """(vendor_id, username) for a valid, unexpired token, else None."""
+    try:
+        payload_part, signature_part = token.split(".")
+        payload, signature = _unb64(payload_part), _unb64(signature_part)
+    except (AttributeError, ValueError):
+        return None
+    if not hmac.compare_digest(hmac.new(SECRET_KEY, payload, hashlib.sha256).digest(), signature):
+        return None
+    vendor_id, rest = payload.decode().split("|", 1)
+    username, expires = rest.rsplit("|", 1)  # Usernames may contain "|"
+    if int(expires) < (time.time() if now is None else now):
+        return None
+    return int(vendor_id), username
+
+
+def current_vendor():
+    """(vendor_id, username) of the vendor logged in to this session, or None."""
+    token = st.session_state.get("vendor_token")
+    return read_token(token) if token else None
@@ -0,0 +1,65 @@
+import time
+import threading
+
+from synthetic import timed
+import auth
+
+# ✅ Login throughput under concurrent attempts, and how responsive everything else stays
+#    meanwhile: the bounded hashing pool against every session hashing on its own thread.
+#    A "probe" thread stands in for other sessions' scripts (a short pure-Python task every 20ms).
+ATTEMPTS = 24
+SESSIONS = (1, 8, 24)
+
+
+def probe_work():
+    return sum(i * i for i in range(20_000))
+
+
+def run(sessions, verify):
+    stored = auth.hash_password("correct horse")
+    latencies, probe = [], []
+    done = threading.Event()
+
+    def session():
+        for _ in range(ATTEMPTS // sessions):
+            start = time.perf_counter()
+            verify("correct horse", stored)
+            latencies.append(time.perf_counter() - start)
+
+    def prober():
+        while not done.is_set():
+            start = time.perf_counter()
+            probe_work()
+            probe.append(time.perf_counter() - start)
+            time.sleep(0.02)
+
+    probe_thread = threading.Thread(target=prober)
+    probe_thread.start()
+    threads = [threading.Thread(target=session) for _ in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    probe_thread.join()
+    latencies.sort()
+    probe.sort()
+    return (len(latencies) / elapsed, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)],
+            probe[int(len(probe) * 0.95)])
+
+
+if __name__ == "__main__":
+    token = auth.issue_token(1, "vendor")
+    print(f"hash cost {timed(lambda: auth.hash_password('x'), 3) / 1000:.0f}ms, "
+          f"token check {timed(lambda: auth.read_token(token), 10_000):.1f}us")
+    baseline = sorted(timed(probe_work, 1) for _ in range(20))[19] / 1000
+    print(f"probe task alone: p95 {baseline:.1f}ms")
+    hasher = auth.PasswordHasher()
+    for sessions in SESSIONS:
+        for label, verify in (("pool", hasher.verify), ("inline", auth.verify_password)):
+            rate, p50, p95, probe = run(sessions, verify)
+            print(f"{sessions:>3} sessions, {label:<6}: {rate:5.1f} logins/s, login p50 {p50 * 1000:5.0f}ms "
+                  f"p95 {p95 * 1000:5.0f}ms, probe p95 {probe * 1000:5.1f}ms")
+    hasher.shutdown()
@@ -0,0 +1,42 @@
+import gc
+import time
+import tracemalloc
+
+import synthetic  # noqa: F401 - puts the app directory on sys.path
+from events import EventBus
+
+# ✅ Fan-out latency and memory per subscriber at 10k subscribers, and cleanup once
+#    subscribers (sessions) go away.
+SUBSCRIBERS = 10_000
+REPEAT = 50
+
+
+def fan_out(bus, topics):
+    """Median seconds to publish once to each of `topics`."""
+    samples = []
+    for round_ in range(REPEAT):
+        start = time.perf_counter()
+        for topic in topics:
+            bus.publish(topic, (2, round_))
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+if __name__ == "__main__":
+    for topics in (1, 100, SUBSCRIBERS):
+        bus = EventBus()
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        subscriptions = [bus.subscribe(n % topics, (1, 0.0)) for n in range(SUBSCRIBERS)]
+        per_subscriber = (tracemalloc.get_traced_memory()[0] - before) / SUBSCRIBERS
+        tracemalloc.stop()
+
+        seconds = fan_out(bus, range(topics))
+        assert all(s.value == (2, REPEAT - 1) for s in subscriptions)
+        del subscriptions
+        gc.collect()
+        fan_out(bus, range(topics))  # Next publish prunes the dead topics
+        print(f"{SUBSCRIBERS:,} subscribers on {topics:>6,} topics: publish to all {seconds * 1000:6.2f}ms "
+              f"({seconds / SUBSCRIBERS * 1e9:4.0f}ns per delivery), {per_subscriber:4.0f} bytes per subscriber, "
+              f"{bus.subscriber_count()} left / {bus.topic_count()} topics after sessions end")
@@ -0,0 +1,53 @@
+import time
+import random
+
+from synthetic import synthetic_menu, timed
+from catalog import Catalog
+
+# ✅ Compares the old homepage hot path (DataFrame masks + to_dict + linear search)
+#    with the catalog indexes, as the menu grows from the real 56 rows to 100k+.
+SIZES = [56, 1_000, 10_000, 100_000, 200_000]
+
+
+def old_rerun(df, category, name):
+    """What homepage(df) did on every rerun before the catalog indexes."""
+    filtered_df = df[df["category"] == category]
+    names = ["Select an item"] + filtered_df["name"].tolist()
+    item_info = filtered_df[filtered_df["name"] == name].iloc[0]
+    recommendations = filtered_df.to_dict(orient="records")
+    selected = next((item for item in recommendations if item["name"] == name), None)
+    return names, item_info, selected
+
+
+def new_rerun(catalog, category, name):
+    """The same work through the prebuilt indexes."""
+    items = catalog.by_category[category]
+    names = ["Select an item", *catalog.names_by_category[category]]
+    item_info = catalog.by_name[name]
+    recs = random.sample(items, min(3, len(items)))
+    selected = catalog.by_name.get(name)
+    return names, item_info, recs, selected
+
+
+def new_lookups_only(catalog, category, name):
+    """Index lookups without building the selectbox options (those are sent to the browser anyway)."""
+    items = catalog.by_category[category]
+    return catalog.by_name[name], random.sample(items, min(3, len(items))), catalog.by_name.get(name)
+
+
+if __name__ == "__main__":
+    print("old/new rerun include building the selectbox options; 'new lookups' is the index work alone.")
+    print(f"{'rows':>8} {'old rerun':>12} {'new rerun':>12} {'new lookups':>12} {'build':>10}")
+    for rows in SIZES:
+        raw = synthetic_menu(rows)
+        start = time.perf_counter()
+        catalog = Catalog.from_frame(raw)
+        build_ms = (time.perf_counter() - start) * 1000
+        category = catalog.categories[0]
+        name = catalog.by_category[category][-1].name
+        repeat = 200 if rows <= 10_000 else 20
+
+        old_us = timed(lambda: old_rerun(catalog.df, category, name), repeat)
+        new_us = timed(lambda: new_rerun(catalog, category, name), repeat)
+        lookup_us = timed(lambda: new_lookups_only(catalog, category, name), 2000)
+        print(f"{rows:>8,} {old_us:>10,.0f}us {new_us:>10,.0f}us {lookup_us:>10,.1f}us {build_ms:>8,.0f}ms")
@@ -0,0 +1,45 @@
+import os
+import time
+import tempfile
+
+from synthetic import timed
+import db
+from live_catalog import LiveCatalog
+from migrations import migrate
+
+# ✅ Keeping the merged menu current: rebuilding it (and its indexes) from scratch after a
+#    vendor edit, against the background refresh via PRAGMA data_version + catalog_changes.
+#    An edit is timed from its commit until readers get the new catalog, indexes built.
+SIZES = [1_000, 10_000, 50_000]
+VENDORS = 20
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "vendor.db")
+            conn = db.connect(path)
+            migrate(conn)
+            conn.executemany("INSERT INTO vendor (username, password) VALUES (?, 'x')",
+                             [(f"vendor{v}",) for v in range(VENDORS)])
+            conn.executemany("INSERT INTO vendor_items (vendor_id, item_name, item_price) VALUES (?, ?, ?)",
+                             [(1 + i % VENDORS, f"Dish {i}", 2.0 + i % 30) for i in range(size)])
+            conn.commit()
+
+            full = timed(lambda: LiveCatalog(path), 3)  # Builds the catalog and its indexes
+            live = LiveCatalog(path)
+            edits = iter(range(10 ** 9))
+
+            def one_edit():
+                before = live.current()
+                conn.execute("UPDATE vendor_items SET item_price=? WHERE id=?", (3.0 + next(edits) % 7, 1))
+                conn.commit()
+                while live.current() is before:
+                    assert not live.refresh_errors
+                    time.sleep(0.0002)
+
+            unchanged = timed(live.current, 2000)
+            incremental = timed(one_edit, 20)
+            print(f"{size:>6,} vendor items: full reload {full / 1000:8.1f}ms | "
+                  f"one edit, live after {incremental / 1000:7.2f}ms (incl. commit) | unchanged check {unchanged:4.1f}us")
+            conn.close()
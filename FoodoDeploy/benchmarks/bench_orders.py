@@ -0,0 +1,84 @@
+import os
+import time
+import random
+import sqlite3
+import tempfile
+import threading
+
+import synthetic  # noqa: F401 - puts the app directory on sys.path
+from migrations import migrate
+from orders import NewOrder, OrderLine, OrderWriter, _insert_order
+
+# ✅ Sustained checkouts/sec with many concurrent sessions: the group-commit writer
+#    against every session committing its own order on its own connection.
+SESSIONS = (1, 16, 64, 256)
+ORDERS_PER_SESSION = 40
+
+
+def synthetic_order(rng, session):
+    lines = tuple(
+        OrderLine(f"fd-{rng.randrange(16 ** 10):010x}", rng.randrange(50), f"Item {i}",
+                  rng.randint(1, 3), rng.randint(200, 4000))
+        for i in range(rng.randint(1, 6))
+    )
+    subtotal = sum(line.quantity * line.unit_cents for line in lines)
+    return NewOrder(f"session-{session}", subtotal, 0, subtotal, (), lines)
+
+
+def run_sessions(sessions, checkout):
+    """Runs `sessions` threads placing ORDERS_PER_SESSION orders each; returns orders/sec."""
+    barrier = threading.Barrier(sessions + 1)
+
+    def session(number):
+        rng = random.Random(number)
+        orders = [synthetic_order(rng, number) for _ in range(ORDERS_PER_SESSION)]
+        barrier.wait()
+        for order in orders:
+            checkout(order)
+
+    threads = [threading.Thread(target=session, args=(n,)) for n in range(sessions)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return sessions * ORDERS_PER_SESSION / (time.perf_counter() - start)
+
+
+def bench_writer(path, sessions):
+    writer = OrderWriter(path)
+    try:
+        rate = run_sessions(sessions, writer.place)
+        return rate, writer.orders_written / max(writer.batches, 1)
+    finally:
+        writer.close()
+
+
+def bench_direct(path, sessions):
+    local = threading.local()
+
+    def checkout(order):
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = local.conn = sqlite3.connect(path, isolation_level=None, timeout=60)
+            conn.execute("PRAGMA synchronous=FULL")
+        conn.execute("BEGIN IMMEDIATE")
+        _insert_order(conn, order, time.time())
+        conn.execute("COMMIT")
+
+    return run_sessions(sessions, checkout)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        for sessions in SESSIONS:
+            direct_path = os.path.join(tmp, f"direct{sessions}.db")
+            conn = sqlite3.connect(direct_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            migrate(conn)
+            conn.close()
+            direct = bench_direct(direct_path, sessions)
+            grouped, per_batch = bench_writer(os.path.join(tmp, f"writer{sessions}.db"), sessions)
+            print(f"{sessions:>4} sessions: group commit {grouped:>8,.0f} orders/s "
+                  f"({per_batch:5.1f} orders/txn), commit per checkout {direct:>8,.0f} orders/s")
@@ -0,0 +1,29 @@
+import re
+
+import synthetic  # noqa: F401 - puts the app directory on sys.path
+from synthetic import APP_DIR
+from routes import ROUTES
+
+# ✅ Bytes of markdown/HTML each route sends on a rerun, and how much of that is <style> CSS.
+#    Runs every route through AppTest twice and measures the second (steady-state) run.
+STYLE_RE = re.compile(r"<style>.*?</style>", re.S)
+
+
+def rerun_bytes(route):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(f"{APP_DIR}/app.py", default_timeout=120)
+    at.query_params["page"] = route
+    at.run()
+    at.run()
+    assert not at.exception, [e.value for e in at.exception]
+    bodies = [element.value for element in at.markdown] + [element.proto.body for element in at.get("html")]
+    total = sum(len(body.encode()) for body in bodies)
+    styles = sum(len(match.encode()) for body in bodies for match in STYLE_RE.findall(body))
+    return total, styles
+
+
+if __name__ == "__main__":
+    for route in ROUTES:
+        total, styles = rerun_bytes(route)
+        print(f"{route:>9}: {total / 1024:6.1f} KiB of markdown/HTML per rerun, {styles / 1024:5.1f} KiB of it <style>")
@@ -0,0 +1,65 @@
+import time
+import random
+
+from synthetic import timed
+from pricing import PricingEngine
+
+# ✅ Compile time and per-cart pricing latency with 10k active rules and 200-line carts,
+#    against a straightforward per-rule, per-line Python loop.
+RULES = 10_000
+LINES = 200
+VENDORS = 500
+CATEGORIES = ["Fast Food", "Dessert", "Drinks", "Soup", "Rice", "Vegetarian", "Non-Vegetarian", "Vendor Specials"]
+
+
+def synthetic_rules(count, rng):
+    rules = []
+    for rule_id in range(1, count + 1):
+        code = f"CODE{rule_id}" if rng.random() < 0.05 else None
+        vendor = rng.randrange(VENDORS) if rng.random() < 0.9 else None
+        category = rng.choice(CATEGORIES) if rng.random() < 0.5 else None
+        percent, amount = (rng.randint(5, 30), 0) if rng.random() < 0.7 else (0, rng.randint(100, 500))
+        min_spend = rng.choice([0, 0, 1000, 2500, 5000])
+        rules.append((rule_id, code, f"Rule {rule_id}", vendor, category, percent, amount, min_spend, rng.random() < 0.5))
+    return rules
+
+
+def loop_price(rules, lines, codes):
+    """Reference implementation: every rule against every line in plain Python."""
+    subtotal = sum(q * p for q, p, _, _ in lines)
+    stack, best = 0, 0
+    for _, code, _, vendor, category, percent, amount, min_spend, stackable in rules:
+        if code is not None and code not in codes:
+            continue
+        eligible = sum(q * p for q, p, v, c in lines
+                       if (vendor is None or vendor == v) and (category is None or category == c))
+        if eligible == 0 or eligible < min_spend:
+            continue
+        discount = min(eligible * percent // 100 + amount, eligible)
+        if stackable:
+            stack += discount
+        else:
+            best = max(best, discount)
+    return subtotal - min(max(stack, best), subtotal)
+
+
+if __name__ == "__main__":
+    rng = random.Random(11)
+    rules = synthetic_rules(RULES, rng)
+    start = time.perf_counter()
+    engine = PricingEngine(rules)
+    print(f"compile {RULES:,} rules: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    for cart_vendors in (5, 50, 200):
+        vendors = rng.sample(range(VENDORS), cart_vendors)
+        lines = [(rng.randint(1, 3), rng.randint(200, 4000), rng.choice(vendors), rng.choice(CATEGORIES))
+                 for _ in range(LINES)]
+        codes = ("CODE42",)
+        result = engine.price(lines, codes)
+        assert result.total_cents == loop_price(rules, lines, codes), "engine and reference disagree"
+        candidates = len(engine.candidates({v for _, _, v, _ in lines},
+                                           {engine.category_index.get(c, -2) for *_, c in lines}, codes))
+        engine_us = timed(lambda: engine.price(lines, codes), 200)
+        loop_us = timed(lambda: loop_price(rules, lines, codes), 3)
+        print(f"{LINES} lines from {cart_vendors:>3} vendors: {candidates:>5,} candidate rules, "
+              f"engine {engine_us:>7,.0f}us, python loop {loop_us / 1000:>7,.0f}ms")
@@ -0,0 +1,30 @@
+import time
+import random
+
+from synthetic import synthetic_menu, timed
+from catalog import Catalog
+from recommend import Recommender
+
+# ✅ Precomputation time, memory and per-session query latency of the
+#    content-based recommender, up to 100k+ menu items.
+SIZES = [56, 10_000, 100_000]
+CART_SIZES = [1, 5, 20]
+
+
+if __name__ == "__main__":
+    rng = random.Random(3)
+    for rows in SIZES:
+        catalog = Catalog.from_frame(synthetic_menu(rows))
+        start = time.perf_counter()
+        recommender = Recommender(catalog)
+        build_s = time.perf_counter() - start
+        matrix_bytes = sum(a.nbytes for a in (recommender.indptr, recommender.indices, recommender.data, recommender.row_ids))
+        print(f"\n{rows:,} items: build {build_s:.2f}s, vocabulary {len(recommender.vocabulary):,}, "
+              f"nnz {len(recommender.data):,}, matrix {matrix_bytes / 2**20:.1f} MiB")
+
+        category = max(catalog.categories, key=lambda c: len(catalog.by_category[c]))
+        for cart_size in CART_SIZES:
+            cart = [item.item_id for item in rng.sample(catalog.items, cart_size)]
+            us = timed(lambda: recommender.recommend(category, cart, k=3), 200)
+            print(f"  cart of {cart_size:>2}: {us:>8,.0f}us per query "
+                  f"(largest category: {len(catalog.by_category[category]):,} items)")
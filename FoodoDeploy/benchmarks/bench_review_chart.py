@@ -0,0 +1,45 @@
+import plotly.express as px
+import plotly.io as pio
+import streamlit as st
+
+from synthetic import synthetic_menu, timed
+from catalog import Catalog
+from reviews import NO_RATINGS
+from review import ratings_chart, ratings_frame
+
+# ✅ The Review page chart per rerun: the old px.bar over every dish in the category, against
+#    the cached figure (st.cache_resource lookup on a hit) and the top-N figure built on a miss.
+SIZES = [56, 1_000, 10_000, 50_000]
+
+
+def old_chart(df, category):
+    """What review_page did on every rerun before the figure cache."""
+    filtered_df = df[df["category"] == category]
+    return px.bar(filtered_df, x="name", y="review", labels={"name": "Food Item", "review": "Review Ratings"},
+                  title=f"📊 Review Distribution for {category}", color="review", color_continuous_scale="Sunset")
+
+
+def new_chart(catalog, category):
+    """A cache miss: aggregates (all empty here) to the bounded figure."""
+    items = catalog.by_category[category]
+    return ratings_chart(category, ratings_frame(items, dict.fromkeys((item.item_id for item in items), NO_RATINGS)))
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        catalog = Catalog.from_frame(synthetic_menu(size))
+        category = max(catalog.categories, key=lambda name: len(catalog.by_category[name]))
+        dishes = len(catalog.by_category[category])
+
+        @st.cache_resource(max_entries=64)
+        def cached_chart(category, catalog_version, version, _catalog):
+            return new_chart(_catalog, category)
+
+        cached_chart(category, catalog.version, 0, catalog)
+        old = timed(lambda: old_chart(catalog.df, category), 5)
+        miss = timed(lambda: new_chart(catalog, category), 5)
+        hit = timed(lambda: cached_chart(category, catalog.version, 0, catalog), 2000)
+        old_bytes = len(pio.to_json(old_chart(catalog.df, category), validate=False))
+        new_bytes = len(pio.to_json(cached_chart(category, catalog.version, 0, catalog), validate=False))
+        print(f"{size:>7,} rows ({dishes:>6,} in '{category}'): old {old / 1000:7.1f}ms, {old_bytes / 1024:8,.0f} KiB | "
+              f"cached hit {hit:5.0f}us, miss {miss / 1000:6.1f}ms, {new_bytes / 1024:5,.0f} KiB")
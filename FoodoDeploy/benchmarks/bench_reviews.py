@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import random
+import tempfile
+
+from synthetic import timed
+import db
+from migrations import migrate
+from reviews import Review, add_reviews, rating_summaries, rating_summary, recent_reviews
+
+# ✅ Reviews at scale: ingest throughput with the aggregates kept in the same transaction,
+#    then average/distribution reads from review_aggregates against computing them from the
+#    review rows. python bench_reviews.py [reviews]  (default 10M; ~1GB of temp disk)
+REVIEWS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+ITEMS = 5_000
+BATCH = 10_000  # Reviews per add_reviews call (one transaction)
+CATEGORY_ITEMS = 20  # Items on one Review page chart
+
+
+def scan_summary(conn, item_id):
+    """What review_aggregates saves: counting an item's review rows."""
+    return conn.execute(
+        "SELECT COUNT(*), SUM(rating), SUM(rating = 1), SUM(rating = 2), SUM(rating = 3), SUM(rating = 4),"
+        " SUM(rating = 5) FROM reviews WHERE item_id = ?", (item_id,)
+    ).fetchone()
+
+
+def batches(rng, item_ids):
+    for start in range(0, REVIEWS, BATCH):
+        yield [
+            Review(rng.choice(item_ids), "bench", "Reviewer", rng.choice((1, 2, 3, 4, 4, 5, 5, 5)), "Tasty.")
+            for _ in range(min(BATCH, REVIEWS - start))
+        ]
+
+
+if __name__ == "__main__":
+    rng = random.Random(7)
+    item_ids = [f"fd-{i:010x}" for i in range(ITEMS)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "vendor.db")
+        conn = db.connect(path)
+        migrate(conn)
+
+        ingest = 0.0
+        for batch in batches(rng, item_ids):  # Generating reviews is not timed
+            start = time.perf_counter()
+            add_reviews(conn, batch)
+            ingest += time.perf_counter() - start
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        print(f"{REVIEWS:,} reviews over {ITEMS:,} items: ingest {REVIEWS / ingest:,.0f} reviews/s "
+              f"({ingest:.1f}s, batches of {BATCH:,}), database {os.path.getsize(path) / 2 ** 20:,.0f} MiB")
+
+        item = item_ids[0]
+        count, total, *histogram = scan_summary(conn, item)
+        assert rating_summary(conn, item) == (count, total, tuple(histogram))
+        category = item_ids[:CATEGORY_ITEMS]
+        one = timed(lambda: rating_summary(conn, item), 2000)
+        chart = timed(lambda: rating_summaries(conn, category), 1000)
+        latest = timed(lambda: recent_reviews(conn, item), 1000)
+        scan = timed(lambda: scan_summary(conn, item), 20)
+        scan_chart = timed(lambda: [scan_summary(conn, item_id) for item_id in category], 5)
+        print(f"  one item:  aggregate {one:6.1f}us | scanning its {count:,} reviews {scan / 1000:8.2f}ms")
+        print(f"  {CATEGORY_ITEMS} items:  aggregate {chart:6.1f}us | scanning {scan_chart / 1000:8.2f}ms")
+        print(f"  newest 10 reviews of one item: {latest:.1f}us")
+
+        single = timed(lambda: add_reviews(conn, [Review(item, "bench", "Reviewer", 5, "Tasty.")]), 200)
+        print(f"  one review submitted (insert + aggregate, committed): {single / 1000:.2f}ms")
+        conn.close()
@@ -0,0 +1,26 @@
+import time
+
+from synthetic import synthetic_menu, timed
+from catalog import Catalog, FoodItem, make_item_id
+from search import SearchIndex
+
+# ✅ Build time, query latency and incremental update cost of the menu search index.
+SIZES = [56, 10_000, 100_000]
+QUERIES = ["chi", "chicken", "chicken ric", "chikcen", "briyani", "halal beef", "pizz", "crispy potato"]
+
+
+if __name__ == "__main__":
+    for rows in SIZES:
+        catalog = Catalog.from_frame(synthetic_menu(rows))
+        start = time.perf_counter()
+        index = SearchIndex(catalog.items)
+        build_s = time.perf_counter() - start
+        print(f"\n{rows:,} items: build {build_s:.2f}s")
+        for query in QUERIES:
+            us = timed(lambda: index.search(query, k=8), 200)
+            print(f"  {query!r:<18} {us:>8,.0f}us  top: {[item.name for item in index.search(query, k=2)]}")
+
+        new_item = FoodItem(make_item_id("Vendor Special Kunafa"), "Vendor Special Kunafa",
+                            "Cheese pastry soaked in syrup.", 900, catalog.categories[0], 4.8)
+        add_us = timed(lambda: (index.add(new_item), index.remove(new_item.item_id)), 200)
+        print(f"  add + remove one item: {add_us:,.0f}us")
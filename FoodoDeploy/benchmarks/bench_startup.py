@@ -0,0 +1,50 @@
+import os
+import sys
+import json
+import subprocess
+
+from synthetic import APP_DIR
+
+# ✅ Time to first render of each ?page= route in a fresh process, with the lazy route
+#    registry, against importing every page up front (what app.py used to do).
+#    Each measurement runs in its own interpreter so nothing is warm; the second run of the
+#    same route shows the steady-state rerun cost.
+RUNS = 5  # Fresh processes per route (the median is reported)
+
+CHILD = """
+import sys, json, time, importlib
+sys.path.insert(0, {app_dir!r})
+start = time.perf_counter()
+if {eager}:
+    for module in ("homepage", "order", "progress", "review", "vendors", "about_us"):
+        importlib.import_module(module)
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.query_params["page"] = {route!r}
+at.run()
+first = time.perf_counter() - start
+assert not at.exception, [e.value for e in at.exception]
+start = time.perf_counter()
+at.run()
+print(json.dumps([first, time.perf_counter() - start]))
+"""
+
+
+def measure(route, eager):
+    results = []
+    for _ in range(RUNS):
+        code = CHILD.format(app_dir=APP_DIR, app=os.path.join(APP_DIR, "app.py"), route=route, eager=eager)
+        output = subprocess.run([sys.executable, "-c", code], cwd=APP_DIR, capture_output=True, text=True, check=True)
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    results.sort()
+    return results[len(results) // 2]
+
+
+if __name__ == "__main__":
+    from routes import ROUTES
+
+    for route in ROUTES:
+        lazy_first, lazy_rerun = measure(route, False)
+        eager_first, _ = measure(route, True)
+        print(f"{route:>9}: first render {lazy_first * 1000:6.0f}ms lazy vs {eager_first * 1000:6.0f}ms "
+              f"importing every page | rerun {lazy_rerun * 1000:5.0f}ms")
@@ -0,0 +1,55 @@
+import os
+import time
+import random
+import tempfile
+
+import synthetic  # noqa: F401 - puts the app directory on sys.path
+import db
+from orders import NewOrder, OrderLine, OrderWriter
+from tracking import OrderTracker
+
+# ✅ One process driving tens of thousands of in-flight orders through their lifecycle:
+#    transitions/sec, worst scheduling lag, and time to resume after a restart.
+IN_FLIGHT = [10_000, 50_000]
+STAGE_SECONDS = {1: 2.0, 2: 2.0, 3: 2.0}
+SPREAD = 3.0  # Orders are placed over this many seconds
+
+
+def place_orders(writer, count):
+    line = (OrderLine("fd-0000000000", 0, "Item", 1, 1000),)
+    futures = [writer.submit(NewOrder(f"session-{i}", 1000, 0, 1000, (), line)) for i in range(count)]
+    return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+    rng = random.Random(12)
+    for count in IN_FLIGHT:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "orders.db")
+            writer = OrderWriter(path)
+            pool = db.ConnectionPool(path)
+            tracker = OrderTracker(writer, STAGE_SECONDS, pool)
+            order_ids = place_orders(writer, count)
+
+            start = time.time()
+            for order_id in order_ids:
+                tracker.track(order_id, start + rng.uniform(0, SPREAD))
+            tracked = time.time() - start
+            while tracker.in_flight():
+                time.sleep(0.05)
+            elapsed = time.time() - start
+            print(f"{count:>6,} orders: track() {tracked / count * 1e6:.1f}us each, "
+                  f"{tracker.transitions:,} transitions in {elapsed:.1f}s "
+                  f"(schedule needs {SPREAD + sum(STAGE_SECONDS.values()):.1f}s), max lag {tracker.max_lag * 1000:.0f}ms")
+            tracker.close()
+
+            # Restart half-way through: every order back in flight, reloaded from the database
+            conn = writer._connect()
+            conn.execute("UPDATE orders SET status = 2")
+            conn.close()
+            start = time.perf_counter()
+            resumed = OrderTracker(writer, STAGE_SECONDS, pool)
+            print(f"{'':>14}resume {resumed.in_flight():,} in-flight orders: {(time.perf_counter() - start) * 1000:.0f}ms")
+            resumed.close()
+            writer.close()
+            pool.close()
@@ -0,0 +1,76 @@
+import os
+import time
+import random
+import tempfile
+
+from synthetic import timed
+import db
+import analytics
+from migrations import migrate
+from orders import NewOrder, OrderLine, _insert_order
+
+# ✅ The vendor Sales Summary as order history grows: a 30-day dashboard computed from the
+#    raw order rows, against reading the hourly/daily rollups, plus what keeping the rollups
+#    costs each order write.
+SIZES = [1_000, 100_000, 500_000]  # Orders over the past year, half of them with the measured vendor
+VENDORS = 10
+ITEMS_PER_VENDOR = 40
+YEAR = 365 * analytics.DAY
+
+
+def raw_dashboard(conn, vendor_id, now):
+    """What the dashboard would cost without rollups: grouping the vendor's order lines."""
+    start = analytics.window_start("Last 30 days", now)
+    series = conn.execute(
+        "SELECT CAST(o.placed_at / 86400 AS INTEGER), COUNT(DISTINCT o.id), SUM(l.quantity),"
+        " SUM(l.quantity * l.unit_cents) FROM order_lines l JOIN orders o ON o.id = l.order_id"
+        " WHERE l.vendor_id = ? AND o.placed_at >= ? GROUP BY 1", (vendor_id, start)
+    ).fetchall()
+    top = conn.execute(
+        "SELECT l.item_id, MAX(l.name), SUM(l.quantity), SUM(l.quantity * l.unit_cents)"
+        " FROM order_lines l JOIN orders o ON o.id = l.order_id WHERE l.vendor_id = ? AND o.placed_at >= ?"
+        " GROUP BY l.item_id ORDER BY 4 DESC LIMIT 5", (vendor_id, start)
+    ).fetchall()
+    return series, top
+
+
+def rollup_dashboard(conn, vendor_id, now):
+    series = analytics.sales_series(conn, vendor_id, "Last 30 days", now)
+    return analytics.sales_totals(series), analytics.top_items(conn, vendor_id, "Last 30 days", now=now)
+
+
+def random_order(rng):
+    vendors = [1] if rng.random() < 0.5 else rng.sample(range(2, VENDORS + 1), 1)
+    lines = tuple(
+        OrderLine(f"v-{vendor}-{item}", vendor, f"Dish {item}", rng.randint(1, 3), rng.randint(200, 2000))
+        for vendor in vendors for item in rng.sample(range(ITEMS_PER_VENDOR), rng.randint(1, 3))
+    )
+    return NewOrder("bench", 0, 0, 0, (), lines)
+
+
+if __name__ == "__main__":
+    rng = random.Random(7)
+    now = time.time()
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = db.connect(os.path.join(tmp, "vendor.db"))
+            migrate(conn)
+            conn.execute("BEGIN")
+            for placed_at in sorted(now - rng.random() * YEAR for _ in range(size)):
+                _insert_order(conn, random_order(rng), placed_at)
+            conn.commit()
+
+            assert rollup_dashboard(conn, 1, now)[0][2] == sum(row[3] for row in raw_dashboard(conn, 1, now)[0])
+            raw = timed(lambda: raw_dashboard(conn, 1, now), 5)
+            rollup = timed(lambda: rollup_dashboard(conn, 1, now), 200)
+
+            orders = [random_order(rng) for _ in range(2000)]
+            conn.execute("BEGIN")
+            start = time.perf_counter()
+            for order in orders:
+                analytics.record_sales(conn, order.lines, now)
+            per_order = (time.perf_counter() - start) / len(orders) * 1e6
+            conn.rollback()
+            print(f"{size:>7,} orders: 30-day dashboard from order rows {raw / 1000:8.2f}ms | "
+                  f"from rollups {rollup / 1000:5.2f}ms | rollup upkeep {per_order:4.0f}us per order")
+            conn.close()
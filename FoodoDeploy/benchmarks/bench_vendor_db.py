@@ -0,0 +1,82 @@
+import os
+import sqlite3
+import tempfile
+import threading
+
+from synthetic import timed
+import db
+from migrations import migrate
+
+# ✅ Database work per Vendor page rerun: the old connect + CREATE TABLE + commit + close
+#    against borrowing a pooled, pre-configured connection. Both then list a vendor's items.
+ITEMS = 200
+THREADS = 8
+LIST_ITEMS = "SELECT id, item_name, item_price FROM vendor_items WHERE vendor_id=?"
+
+
+def per_rerun_connection(path, query=True):
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS vendor (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS vendor_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            vendor_id INTEGER NOT NULL,
+            item_name TEXT NOT NULL,
+            item_price REAL NOT NULL,
+            FOREIGN KEY (vendor_id) REFERENCES vendor(id) ON DELETE CASCADE
+        )
+    """)
+    conn.commit()
+    if query:
+        cursor.execute(LIST_ITEMS, (1,))
+        cursor.fetchall()
+    conn.close()
+
+
+def pooled_connection(pool, query=True):
+    with pool.connection() as conn:
+        if query:
+            conn.execute(LIST_ITEMS, (1,)).fetchall()
+
+
+def concurrent(fn, reruns=200):
+    """Median microseconds per rerun with THREADS sessions rerunning at once."""
+    results = []
+
+    def session():
+        results.append(timed(fn, reruns))
+
+    threads = [threading.Thread(target=session) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sorted(results)[len(results) // 2]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "vendor.db")
+        conn = db.connect(path)
+        migrate(conn)
+        conn.execute("INSERT INTO vendor (username, password) VALUES ('bench', 'x')")
+        conn.executemany("INSERT INTO vendor_items (vendor_id, item_name, item_price) VALUES (1, ?, ?)",
+                         [(f"Item {i}", 5.0 + i % 20) for i in range(ITEMS)])
+        conn.commit()
+        conn.close()
+
+        pool = db.ConnectionPool(path)
+        for query, label in ((False, "connection only"), (True, f"+ list {ITEMS} items")):
+            before = timed(lambda: per_rerun_connection(path, query), 500)
+            after = timed(lambda: pooled_connection(pool, query), 500)
+            print(f"1 session,  {label:<16}: per-rerun connection {before:5.0f}us, pooled {after:5.0f}us")
+            before = concurrent(lambda: per_rerun_connection(path, query))
+            after = concurrent(lambda: pooled_connection(pool, query))
+            print(f"{THREADS} sessions, {label:<16}: per-rerun connection {before:5.0f}us, pooled {after:5.0f}us")
@@ -0,0 +1,91 @@
+import os
+import csv
+import time
+import tempfile
+import tracemalloc
+
+import synthetic  # noqa: F401 - puts the app directory on sys.path
+import db
+import vendor_io
+from migrations import migrate
+
+# ✅ Bulk import of 100k items (CSV and Parquet) in one streaming transaction, against the
+#    Add Item form's one INSERT + commit per item, plus the streaming export.
+ROWS = 100_000
+FORM_ROWS = 2_000  # The per-item path is slow - time a sample and scale it
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(vendor_io.COLUMNS)
+        for i in range(rows):
+            writer.writerow((f"Item {i}", f"{1 + i % 50}.{i % 100:02d}" if i % 1000 else "oops"))
+
+
+def fresh_db(path):
+    conn = db.connect(path)
+    migrate(conn)
+    conn.execute("INSERT INTO vendor (username, password) VALUES ('bench', 'x')")
+    conn.commit()
+    return conn
+
+
+def measure(fn):
+    """(result, seconds, peak MB). Timed untraced; the peak comes from a second, traced run."""
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def import_file(db_path, file_path, read_rows):
+    """Imports a file into a fresh database."""
+    conn = fresh_db(db_path)
+    try:
+        with open(file_path, "rb") as upload:
+            return vendor_io.import_items(conn, 1, read_rows(upload))
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "items.csv")
+        write_csv(csv_path, ROWS)
+        print(f"{ROWS:,} rows, {os.path.getsize(csv_path) / 1024 / 1024:.1f} MB CSV")
+
+        runs = iter(range(100))
+        result, elapsed, peak = measure(
+            lambda: import_file(os.path.join(tmp, f"csv{next(runs)}.db"), csv_path, vendor_io.read_csv_rows))
+        print(f"CSV import:     {elapsed:5.2f}s, {result.imported:,} imported, {result.error_count:,} rejected, "
+              f"peak {peak:.1f} MB")
+
+        conn = db.connect(os.path.join(tmp, "csv0.db"))
+        _, elapsed, peak = measure(lambda: sum(len(chunk) for chunk in vendor_io.iter_export_csv(conn, 1)))
+        print(f"CSV export:     {elapsed:5.2f}s, peak {peak:.1f} MB")
+        conn.close()
+
+        if vendor_io.pq is not None:
+            import pyarrow.csv as pacsv
+
+            parquet_path = os.path.join(tmp, "items.parquet")
+            vendor_io.pq.write_table(pacsv.read_csv(csv_path, convert_options=pacsv.ConvertOptions(
+                column_types={"item_price": "string"})), parquet_path)
+            result, elapsed, peak = measure(lambda: import_file(
+                os.path.join(tmp, f"parquet{next(runs)}.db"), parquet_path, vendor_io.read_parquet_rows))
+            print(f"Parquet import: {elapsed:5.2f}s, {result.imported:,} imported, peak {peak:.1f} MB")
+
+        conn = fresh_db(os.path.join(tmp, "form.db"))
+        start = time.perf_counter()
+        for i in range(FORM_ROWS):
+            conn.execute(vendor_io.INSERT_ITEMS, (1, f"Item {i}", 5.0))
+            conn.commit()
+        per_item = (time.perf_counter() - start) / FORM_ROWS
+        print(f"One commit per item (Add Item form, DB work only): {per_item * 1e6:.0f}us each "
+              f"-> {per_item * ROWS:.1f}s for {ROWS:,}")
+        conn.close()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import tracemalloc
+
+from synthetic import timed
+import db
+from migrations import migrate
+from vendors import FIND_ITEMS, ITEM_SUMMARY, LIST_ITEMS
+
+# ✅ "Manage Your Items" for vendors with thousands of SKUs: fetching every item and summing
+#    in Python, against one keyset page plus a COUNT/SUM over a covering index.
+SIZES = [100, 10_000, 100_000]
+PAGE_SIZE = 25
+OTHER_VENDORS = 20  # Other vendors' items share the table
+
+
+def fetch_all(conn, vendor_id):
+    items = conn.execute("SELECT id, item_name, item_price FROM vendor_items WHERE vendor_id=?",
+                         (vendor_id,)).fetchall()
+    return len(items), sum(item[2] for item in items)
+
+
+def one_page(conn, vendor_id, after_id=0, pattern=None):
+    if pattern:
+        return conn.execute(FIND_ITEMS, (vendor_id, after_id, pattern, PAGE_SIZE + 1)).fetchall()
+    return conn.execute(LIST_ITEMS, (vendor_id, after_id, PAGE_SIZE + 1)).fetchall()
+
+
+def summary(conn, vendor_id):
+    return conn.execute(ITEM_SUMMARY, (vendor_id,)).fetchone()
+
+
+def peak_kib(fn):
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            conn = db.connect(os.path.join(tmp, "vendor.db"))
+            migrate(conn)
+            conn.executemany("INSERT INTO vendor (username, password) VALUES (?, 'x')",
+                             [(f"vendor{v}",) for v in range(OTHER_VENDORS + 1)])
+            rows = [(1, f"Item {i}", 1.0 + i % 30) for i in range(size)]
+            rows += [(v, f"Other {i}", 2.0) for v in range(2, OTHER_VENDORS + 2) for i in range(size // 10)]
+            conn.executemany("INSERT INTO vendor_items (vendor_id, item_name, item_price) VALUES (?, ?, ?)", rows)
+            conn.commit()
+            assert fetch_all(conn, 1) == summary(conn, 1)
+
+            last_page_start = conn.execute(
+                "SELECT id FROM vendor_items WHERE vendor_id=1 ORDER BY id DESC LIMIT 1 OFFSET ?", (PAGE_SIZE,)
+            ).fetchone()[0]
+            old = timed(lambda: fetch_all(conn, 1), 20)
+            first = timed(lambda: one_page(conn, 1), 200)
+            last = timed(lambda: one_page(conn, 1, last_page_start), 200)
+            filtered = timed(lambda: one_page(conn, 1, 0, "%99%"), 50)
+            totals = timed(lambda: summary(conn, 1), 50)
+            print(f"{size:>7,} items: fetch all + sum {old / 1000:7.2f}ms ({peak_kib(lambda: fetch_all(conn, 1)):6,.0f} KiB) | "
+                  f"page 1 {first:4.0f}us, last page {last:4.0f}us ({peak_kib(lambda: one_page(conn, 1)):.0f} KiB), "
+                  f"filtered page {filtered:5.0f}us, COUNT/SUM {totals / 1000:5.2f}ms")
+            conn.close()
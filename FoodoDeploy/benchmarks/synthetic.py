@@ -0,0 +1,47 @@
+import os
+import sys
+import random
+
+import pandas as pd
+
+# ✅ Benchmarks run from anywhere - make the app modules importable
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+from catalog import CATALOG_PATH  # noqa: E402
+
+
+def synthetic_menu(rows, seed=7):
+    """A raw menu DataFrame shaped like food_data.csv, grown to `rows` rows.
+
+    Categories, words and prices are sampled from the real menu so text and
+    category sizes stay realistic. Names get a numeric suffix to stay unique.
+    """
+    rng = random.Random(seed)
+    base = pd.read_csv(CATALOG_PATH, encoding="utf-8")
+    base.columns = base.columns.str.strip().str.lower()
+    categories = base["category"].unique().tolist()
+    name_words = " ".join(base["name"]).replace("(", "").replace(")", "").split()
+    desc_words = " ".join(base["desc"]).replace(".", "").split()
+
+    names, descs, prices, cats, reviews = [], [], [], [], []
+    for i in range(rows):
+        names.append(f"{' '.join(rng.sample(name_words, 2))} #{i}")
+        descs.append(" ".join(rng.choices(desc_words, k=rng.randint(4, 9))) + ".")
+        prices.append(f"${rng.randint(2, 40)}" if rng.random() < 0.8 else f"${rng.randint(2, 40)}.{rng.randint(1, 99):02d}")
+        cats.append(rng.choice(categories))
+        reviews.append(round(rng.uniform(3.0, 5.0), 1))
+    return pd.DataFrame({"name": names, "desc": descs, "price": prices, "category": cats, "review": reviews})
+
+
+def timed(fn, repeat=200):
+    """Median wall time of fn() in microseconds."""
+    import time
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples[len(samples) // 2]
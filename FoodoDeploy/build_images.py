@@ -0,0 +1,164 @@
+import os
+import io
+import json
+import argparse
+
+# ✅ Build-time only: needs Pillow with WebP support (pip install pillow).
+#    The app itself never imports this file - it just reads images/derived/manifest.json.
+from PIL import Image, ImageOps
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(BASE_DIR, "images")
+DERIVED_DIR = os.path.join(IMAGES_DIR, "derived")
+MANIFEST_PATH = os.path.join(DERIVED_DIR, "manifest.json")
+
+# ✅ Display slots - CSS size on the page, rendered at 2x for high-DPI screens
+#    box: (width, height) for a cover crop, or None to keep the aspect ratio
+SLOTS = {
+    "team": {"box": (300, 300), "max_width": None, "max_height": None, "quality": 80},  # 150px round cards
+    "logo": {"box": None, "max_width": None, "max_height": 120, "quality": 82},  # 60px page header logos
+    "header_logo": {"box": None, "max_width": None, "max_height": 110, "quality": 82},  # 55px navbar logo
+    "hero": {"box": None, "max_width": 1280, "max_height": 760, "quality": 75},  # 380px hero banner
+    "background": {"box": None, "max_width": 1920, "max_height": 1080, "quality": 70},  # full-page backdrop
+}
+
+# ✅ Which image each page draws in which slot (drives the build and the report)
+PAGE_IMAGES = {
+    "Navbar (every page)": [("headlogo.jpg", "header_logo")],
+    "Homepage": [("flas.jpg", "background"), ("flside.jpeg", "hero")],
+    "Order": [("flas.jpg", "background"), ("orderlogo.jpeg", "logo")],
+    "Progress": [("flas.jpg", "background"), ("progresslogo.jpg", "logo")],
+    "Review": [("flas.jpg", "background"), ("reviewlogo.jpg", "logo")],
+    "Vendor": [("flas.jpg", "background"), ("venderslogo.jpeg", "logo")],
+    "AboutUs": [
+        ("flas.jpg", "background"),
+        ("aboutuslogo.jpg", "logo"),
+        ("istructor.jpg", "team"),
+        ("zaib.jpg", "team"),
+        ("zubair.jpg", "team"),
+        ("huzaifa.jpg", "team"),
+        ("jannat.jpg", "team"),
+        ("farhan.jpg", "team"),
+    ],
+}
+
+
+def has_alpha(image):
+    return image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+
+
+def resize_for_slot(image, slot):
+    """Resizes (never upscales) an image to fit a slot."""
+    spec = SLOTS[slot]
+    if spec["box"]:
+        width, height = spec["box"]
+        if image.width >= width and image.height >= height:
+            return ImageOps.fit(image, (width, height), Image.LANCZOS)
+        return image.copy()
+
+    scale = 1.0
+    if spec["max_width"]:
+        scale = min(scale, spec["max_width"] / image.width)
+    if spec["max_height"]:
+        scale = min(scale, spec["max_height"] / image.height)
+    if scale >= 1.0:
+        return image.copy()
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    return image.resize(size, Image.LANCZOS)
+
+
+def encode(image, fmt, quality):
+    buffer = io.BytesIO()
+    if fmt == "WEBP":
+        image.save(buffer, "WEBP", quality=quality, method=6)
+    elif fmt == "JPEG":
+        image.convert("RGB").save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def build_variant(image_name, slot):
+    """Writes the WebP + fallback derivatives for one (image, slot) pair. Returns its manifest entry."""
+    source_path = os.path.join(IMAGES_DIR, image_name)
+    with Image.open(source_path) as source:
+        source = ImageOps.exif_transpose(source)
+        alpha = has_alpha(source)
+        image = source.convert("RGBA" if alpha else "RGB")
+    resized = resize_for_slot(image, slot)
+    quality = SLOTS[slot]["quality"]
+
+    stem = os.path.splitext(image_name)[0]
+    fallback_fmt, fallback_ext = ("PNG", "png") if alpha else ("JPEG", "jpg")
+    outputs = {
+        "webp": (f"{stem}.{slot}.webp", encode(resized, "WEBP", quality)),
+        "fallback": (f"{stem}.{slot}.{fallback_ext}", encode(resized, fallback_fmt, quality)),
+    }
+
+    entry = {"width": resized.width, "height": resized.height, "original_bytes": os.path.getsize(source_path)}
+    for kind, (file_name, data) in outputs.items():
+        if kind == "fallback" and len(data) >= entry["original_bytes"]:
+            # Recompressing made it bigger - the original already is the best fallback
+            entry["fallback"] = {"file": image_name, "bytes": entry["original_bytes"]}
+            continue
+        with open(os.path.join(DERIVED_DIR, file_name), "wb") as f:
+            f.write(data)
+        entry[kind] = {"file": f"derived/{file_name}", "bytes": len(data)}
+    return entry
+
+
+def build(verbose=True):
+    """Builds every derivative listed in PAGE_IMAGES and writes the manifest."""
+    os.makedirs(DERIVED_DIR, exist_ok=True)
+    variants = {}
+    for uses in PAGE_IMAGES.values():
+        for image_name, slot in uses:
+            if slot in variants.get(image_name, {}):
+                continue
+            entry = build_variant(image_name, slot)
+            variants.setdefault(image_name, {})[slot] = entry
+            if verbose:
+                print(f"  {image_name:<20} {slot:<12} {entry['width']}x{entry['height']}  "
+                      f"{entry['original_bytes']:>8,} -> webp {entry['webp']['bytes']:>7,} / "
+                      f"fallback {entry['fallback']['bytes']:>7,}")
+
+    manifest = {"slots": SLOTS, "variants": variants, "report": page_report(variants)}
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
+
+
+def page_report(variants):
+    """Bytes each page used to download vs. what it downloads now (WebP, and the fallback path)."""
+    report = {}
+    for page, uses in PAGE_IMAGES.items():
+        original = webp = fallback = 0
+        for image_name, slot in uses:
+            entry = variants[image_name][slot]
+            original += entry["original_bytes"]
+            webp += entry["webp"]["bytes"]
+            fallback += entry["fallback"]["bytes"]
+        report[page] = {"original": original, "webp": webp, "fallback": fallback, "saved": original - webp}
+    return report
+
+
+def print_report(report):
+    print(f"\n{'Page':<22}{'Original':>12}{'WebP':>12}{'Fallback':>12}{'Saved':>12}")
+    for page, row in report.items():
+        print(f"{page:<22}{row['original']:>12,}{row['webp']:>12,}{row['fallback']:>12,}"
+              f"{row['saved']:>12,} ({row['saved'] / row['original']:.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build resized WebP/JPEG page images and their manifest.")
+    parser.add_argument("--report-only", action="store_true", help="Print the saved-bytes report from the manifest")
+    args = parser.parse_args()
+
+    if args.report_only:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            print_report(json.load(f)["report"])
+    else:
+        print("✅ Building image derivatives...")
+        print_report(build()["report"])
+        print(f"\n✅ Manifest written to {os.path.relpath(MANIFEST_PATH, BASE_DIR)}")
@@ -0,0 +1,81 @@
+import streamlit as st
+
+
+class Cart:
+    """A session's cart: item id -> (quantity, unit price in cents), with a running subtotal.
+
+    Only ids and integers are stored - names and descriptions are looked up in
+    the shared catalog when the cart is drawn. Every operation is O(1).
+    """
+
+    __slots__ = ("_lines", "subtotal_cents", "item_count")
+
+    def __init__(self):
+        self._lines = {}
+        self.subtotal_cents = 0
+        self.item_count = 0  # Total quantity across all lines
+
+    def __len__(self):
+        return len(self._lines)
+
+    def __bool__(self):
+        return bool(self._lines)
+
+    def __contains__(self, item_id):
+        return item_id in self._lines
+
+    def __iter__(self):
+        """Yields (item_id, quantity, unit_cents) in the order items were first added."""
+        for item_id, (quantity, unit_cents) in self._lines.items():
+            yield item_id, quantity, unit_cents
+
+    def quantity(self, item_id):
+        line = self._lines.get(item_id)
+        return line[0] if line else 0
+
+    def add(self, item_id, unit_cents, quantity=1):
+        """Adds quantity of an item at the given price and returns its new quantity."""
+        if quantity <= 0:
+            raise ValueError("Quantity to add must be positive")
+        return self.set_quantity(item_id, self.quantity(item_id) + quantity, unit_cents)
+
+    def set_quantity(self, item_id, quantity, unit_cents=None):
+        """Sets an item's quantity (0 removes it) and returns it.
+
+        unit_cents is required for items not yet in the cart; passing it for an
+        existing line re-prices that line.
+        """
+        if quantity < 0:
+            raise ValueError("Quantity cannot be negative")
+        old_quantity, old_price = self._lines.get(item_id, (0, 0))
+        if unit_cents is None:
+            if item_id not in self._lines and quantity:
+                raise KeyError(item_id)
+            unit_cents = old_price
+        self.subtotal_cents += quantity * unit_cents - old_quantity * old_price
+        self.item_count += quantity - old_quantity
+        if quantity:
+            self._lines[item_id] = (quantity, unit_cents)
+        else:
+            self._lines.pop(item_id, None)
+        return quantity
+
+    def remove(self, item_id):
+        """Removes an item entirely. Unknown ids are ignored."""
+        if item_id in self._lines:
+            self.set_quantity(item_id, 0)
+
+    def clear(self):
+        self._lines.clear()
+        self.subtotal_cents = 0
+        self.item_count = 0
+
+    def item_ids(self):
+        return list(self._lines)
+
+
+def get_cart():
+    """Returns this session's cart, creating it on first use."""
+    if not isinstance(st.session_state.get("cart"), Cart):
+        st.session_state.cart = Cart()
+    return st.session_state.cart
@@ -0,0 +1,128 @@
+import os
+import itertools
+import hashlib
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple
+
+import pandas as pd
+
+# ✅ The menu file lives next to this module, whatever the working directory is
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "food_data.csv")
+HOUSE_VENDOR_ID = 0  # Vendor id of the items in food_data.csv
+HOUSE_VENDOR = "Food Flow"
+VENDOR_CATEGORY = "Vendor Specials"  # Default category for vendor items (see migration 6)
+COLUMNS = ["item_id", "name", "desc", "price_cents", "category", "review", "vendor_id", "vendor"]
+_versions = itertools.count(1)
+
+
+def parse_price(value):
+    """Parses a price like "$10", "10.50" or 10.5 into integer cents."""
+    text = str(value).strip().replace("$", "").replace(",", "")
+    try:
+        cents = (Decimal(text) * 100).quantize(Decimal(1))
+    except InvalidOperation:
+        raise ValueError(f"Invalid price: {value!r}") from None
+    if cents < 0:
+        raise ValueError(f"Negative price: {value!r}")
+    return int(cents)
+
+
+def format_price(cents):
+    """Formats integer cents for display: 1000 -> "$10", 1050 -> "$10.50"."""
+    dollars, rest = divmod(int(cents), 100)
+    return f"${dollars}" if rest == 0 else f"${dollars}.{rest:02d}"
+
+
+def make_item_id(name):
+    """Stable id for a menu item - the same name always gets the same id, across reloads and processes."""
+    digest = hashlib.blake2b(name.strip().lower().encode("utf-8"), digest_size=5).hexdigest()
+    return f"fd-{digest}"
+
+
+class FoodItem(NamedTuple):
+    """One menu item. Immutable, so it can be shared by every session."""
+    item_id: str
+    name: str
+    desc: str
+    price_cents: int
+    category: str
+    review: float
+    vendor_id: int = HOUSE_VENDOR_ID
+    vendor: str = HOUSE_VENDOR
+
+    @property
+    def price(self):
+        return format_price(self.price_cents)
+
+
+class Catalog:
+    """Typed, indexed view of the menu. Build it once, then only read from it.
+
+    A catalog made by applying changes to another one records where it came
+    from (derived_from) and what changed (upserted items, removed ids), so
+    shared indexes can be patched instead of rebuilt.
+    """
+
+    def __init__(self, df, items=None, derived_from=None, upserted=(), removed=()):
+        self.df = df
+        self.items = items if items is not None else tuple(
+            FoodItem(*row) for row in zip(
+                df["item_id"], df["name"], df["desc"], df["price_cents"], df["category"].astype(str),
+                df["review"], df["vendor_id"], df["vendor"],
+            )
+        )
+        self.version = next(_versions)  # Unique per Catalog in this process - a cache key for derived data
+        self.derived_from = derived_from
+        self.upserted = tuple(upserted)
+        self.removed = tuple(removed)
+
+        # ✅ Prebuilt indexes - pages look things up here instead of filtering the DataFrame
+        self.by_id = {item.item_id: item for item in self.items}
+        self.by_name = {}
+        by_category = {}
+        for item in self.items:
+            self.by_name.setdefault(item.name, item)
+            by_category.setdefault(item.category, []).append(item)
+        self.categories = tuple(by_category)  # First-appearance order, as in the CSV
+        self.by_category = {category: tuple(items) for category, items in by_category.items()}
+        self.names_by_category = {
+            category: tuple(item.name for item in items) for category, items in self.by_category.items()
+        }
+
+    @classmethod
+    def from_frame(cls, raw_df):
+        """Normalizes a raw menu DataFrame (name, desc, price, category, review) into a Catalog."""
+        df = raw_df.copy()
+        df.columns = df.columns.str.strip().str.lower()  # Standardize column names
+        df["name"] = df["name"].astype(str).str.strip()
+        df["desc"] = df["desc"].fillna("").astype(str)
+        df["price_cents"] = df["price"].map(parse_price).astype("int64")
+        df["review"] = pd.to_numeric(df["review"], errors="coerce").fillna(0.0).astype("float64")
+        df["category"] = df["category"].astype(str).str.strip()
+        df["category"] = pd.Categorical(df["category"], categories=df["category"].unique())
+        df["item_id"] = df["name"].map(make_item_id)
+        if df["item_id"].duplicated().any():
+            duplicates = df.loc[df["item_id"].duplicated(), "name"].tolist()
+            raise ValueError(f"Duplicate menu item names: {duplicates}")
+        df["vendor_id"] = HOUSE_VENDOR_ID
+        df["vendor"] = HOUSE_VENDOR
+        df = df[COLUMNS]
+        return cls(df.reset_index(drop=True))
+
+    @classmethod
+    def from_items(cls, items, **changes):
+        """A Catalog over FoodItems that are already parsed (categories keep first-appearance order)."""
+        items = tuple(items)
+        df = pd.DataFrame(items, columns=COLUMNS)
+        df["price_cents"] = df["price_cents"].astype("int64")
+        df["review"] = df["review"].astype("float64")
+        df["vendor_id"] = df["vendor_id"].astype("int64")
+        df["category"] = pd.Categorical(df["category"], categories=df["category"].unique())
+        return cls(df, items, **changes)
+
+    @classmethod
+    def from_csv(cls, path=CATALOG_PATH):
+        return cls.from_frame(pd.read_csv(path, encoding="utf-8"))
+
+    def __len__(self):
+        return len(self.items)
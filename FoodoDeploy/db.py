@@ -0,0 +1,107 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+
+from migrations import migrate
+
+# ✅ The app database lives next to this file, whatever the working directory is
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vendor.db")
+
+# ✅ Applied to every connection. WAL lets readers run alongside the writer; NORMAL
+#    sync is crash-safe in WAL mode (the order writer asks for FULL on its own connection).
+PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("foreign_keys", "ON"),
+    ("mmap_size", 64 * 1024 * 1024),
+    ("cache_size", -8000),  # Negative = KiB, so ~8MB of page cache per connection
+    ("busy_timeout", 5000),
+)
+CACHED_STATEMENTS = 256  # Prepared statements kept per connection, keyed by SQL text
+POOL_SIZE = 8
+POOL_TIMEOUT = 10  # Seconds to wait for a free connection before giving up
+MAX_IDS_PER_QUERY = 500  # Keeps IN (...) lists under SQLite's bound-parameter limit
+
+
+def configure(conn):
+    for name, value in PRAGMAS:
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+def connect(path=DB_PATH):
+    """Opens a tuned connection to the app database (usable from any thread, one at a time)."""
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=CACHED_STATEMENTS)
+    return configure(conn)
+
+
+def fetch_in(conn, sql, ids):
+    """Rows of `sql` (ending in "IN") for every id, MAX_IDS_PER_QUERY ids per query."""
+    ids = list(ids)
+    rows = []
+    for start in range(0, len(ids), MAX_IDS_PER_QUERY):
+        chunk = ids[start:start + MAX_IDS_PER_QUERY]
+        rows += conn.execute(f"{sql} ({','.join('?' * len(chunk))})", chunk).fetchall()
+    return rows
+
+
+class ConnectionPool:
+    """A fixed-size pool of long-lived connections, shared by every session thread.
+
+    Connections are opened lazily up to `size` and handed out one thread at a
+    time. Because they stay open, PRAGMA setup happens once per connection and
+    sqlite3's per-connection statement cache keeps repeated queries prepared.
+    """
+
+    def __init__(self, path=DB_PATH, size=POOL_SIZE):
+        self.path = path
+        self.size = size
+        self._idle = queue.LifoQueue()  # Most recently used first - its pages are warmest
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """Borrows a connection; an unfinished transaction is rolled back when it is returned."""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                return connect(self.path)
+        try:
+            return self._idle.get(timeout=POOL_TIMEOUT)
+        except queue.Empty:
+            raise TimeoutError("No database connection available") from None
+
+    def close(self):
+        """Closes the idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# ✅ One pool per process; pending migrations run once, when the pool is first built
+@st.cache_resource
+def get_pool():
+    pool = ConnectionPool()
+    with pool.connection() as conn:
+        migrate(conn)
+    return pool
@@ -0,0 +1,77 @@
+import threading
+import weakref
+
+import streamlit as st
+
+
+class Subscription:
+    """One subscriber's view of a topic: the latest value published to it and a version counter.
+
+    The bus only holds subscriptions weakly - keep a reference (e.g. in
+    st.session_state) for as long as you want updates. Once it is dropped,
+    for instance when the browser session ends, it disappears from the bus.
+    """
+
+    __slots__ = ("topic", "value", "version", "__weakref__")
+
+    def __init__(self, topic, value=None):
+        self.topic = topic
+        self.value = value
+        self.version = 0
+
+    def _deliver(self, value):
+        self.value = value
+        self.version += 1
+
+
+class EventBus:
+    """In-process publish/subscribe keyed by topic (e.g. an order id).
+
+    Each topic maps to a WeakSet of subscriptions, so publishing touches only
+    the sessions following that topic, and sessions that go away need no
+    unsubscribe call. Topics with no live subscribers are dropped on the next
+    publish, and a final publish (e.g. "Delivered") drops the topic outright.
+    """
+
+    def __init__(self):
+        self._topics = {}  # topic -> WeakSet of Subscription
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, topic, value=None):
+        subscription = Subscription(topic, value)
+        with self._lock:
+            subscribers = self._topics.get(topic)
+            if subscribers is None:
+                subscribers = self._topics[topic] = weakref.WeakSet()
+            subscribers.add(subscription)
+        return subscription
+
+    def publish(self, topic, value, final=False):
+        """Delivers value to every live subscriber of topic. Returns how many got it."""
+        with self._lock:
+            subscribers = self._topics.get(topic)
+            if subscribers is None:
+                return 0
+            receivers = list(subscribers)
+            if final or not receivers:
+                del self._topics[topic]
+        for subscription in receivers:
+            subscription._deliver(value)
+        self.published += 1
+        return len(receivers)
+
+    def subscriber_count(self, topic=None):
+        with self._lock:
+            if topic is not None:
+                return len(self._topics.get(topic, ()))
+            return sum(len(subscribers) for subscribers in self._topics.values())
+
+    def topic_count(self):
+        return len(self._topics)
+
+
+# ✅ One bus per process, shared by every session
+@st.cache_resource
+def get_event_bus():
+    return EventBus()
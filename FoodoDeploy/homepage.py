@@ -1,100 +1,34 @@
-import os
-import base64
+import html
 import streamlit as st
 import random
-
-# Function to Convert an Image to Base64 for CSS Embedding
-def get_base64_image(image_filename):
-    """Encodes an image in Base64 format for embedding in HTML."""
-    image_path = os.path.join(os.path.dirname(__file__), "images", image_filename)
-
-    if not os.path.exists(image_path):
-        raise FileNotFoundError(f"⚠️ Image file '{image_path}' not found. Check the path!")
-
-    with open(image_path, "rb") as img_file:
-        return base64.b64encode(img_file.read()).decode()
-
-# Convert images to Base64
-bg_image_base64 = get_base64_image("flas.jpg")  # Background Image
-hero_image_base64 = get_base64_image("flside.jpeg")  # Hero Section Image
-
-def homepage(df):
-    # Custom CSS for Modern UI
-    st.markdown(f"""
-        <style>
-            /* Full-Page Background */
-            .stApp {{
-                background: url('data:image/jpg;base64,{bg_image_base64}') no-repeat center center fixed;
-                background-size: cover;
-            }}
-
-            /* Hero Section */
-            .hero-container {{
-                width: 100%;
-                height: 380px;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                text-align: center;
-                color: white;
-                text-shadow: 3px 3px 10px rgba(0,0,0,0.8);
-                background: url('data:image/jpeg;base64,{hero_image_base64}') no-repeat center center;
-                background-size: cover;
-                border-radius: 15px;
-                position: relative;
-                box-shadow: 0px 2px 5px rgba(252, 252, 252, 0.86);
-            }}
-
-            .hero-overlay {{
-                position: absolute;
-                top: 0;
-                left: 0;
-                width: 100%;
-                height: 100%;
-                background: rgba(0, 0, 0, 0.6); /* Dark Overlay */
-                border-radius: 15px;
-            }}
-
-            .hero-content {{
-                position: relative;
-                z-index: 2;
-            }}
-
-            .hero-content h1 {{
-                font-size: 55px;
-                font-weight: bold;
-                margin-bottom: 15px;
-                color: #ffcc00; /* Gold */
-            }}
-
-            .hero-content p {{
-                font-size: 24px;
-                font-weight: 300;
-                color: white;
-                margin-bottom: 25px;
-            }}
-
-            /* Stylish Cards */
-            .card {{
-                background: #333;
-                padding: 20px;
-                border-radius: 12px;
-                box-shadow: 0 6px 15px rgba(0, 0, 0, 0.3);
-                transition: all 0.3s ease-in-out;
-                color: #ffcc00;
-                text-align: center;
-                cursor: pointer;
-            }}
-
-            .card:hover {{
-                transform: translateY(-5px);
-                box-shadow: 0 8px 18px rgba(0, 0, 0, 0.5);
-            }}
-        </style>
-    """, unsafe_allow_html=True)
-
-    # Hero Section
-    st.markdown(f"""
+from cart import get_cart
+from catalog import HOUSE_VENDOR_ID
+from db import get_pool
+from live_catalog import load_catalog
+from ranking import get_rankings
+from recommend import get_recommender
+from reviews import ratings_version
+from search import get_search_index
+
+# Score used by "Top Rated" (see ranking.SCORES: review, review_count, price)
+TOP_RATED_SCORE = "review"
+# Matches shown for a search query
+SEARCH_RESULTS = 8
+
+# Credit line for dishes sold by a vendor (house dishes need none)
+def vendor_credit(item):
+    return "" if item.vendor_id == HOUSE_VENDOR_ID else f" · by {html.escape(item.vendor)}"
+
+def top_rated(catalog):
+    """Rankings ordered by the stored review aggregates (rebuilt only after new reviews)."""
+    with get_pool().connection() as conn:
+        return get_rankings(catalog, ratings_version(conn), conn)
+
+def homepage():
+    catalog = load_catalog()
+
+    # Hero Section (styles and background image come from theme.py)
+    st.markdown("""
         <div class="hero-container">
             <div class="hero-overlay"></div>
             <div class="hero-content">
@@ -108,7 +42,7 @@ def homepage(df):
 
     # Cuisine Selection
     st.markdown("## 🌍 Choose Your Cuisine")
-    categories = df["category"].unique().tolist()
+    categories = list(catalog.categories)
     category_cols = st.columns(len(categories))
     selected_category = None
 
@@ -121,59 +55,84 @@ def homepage(df):
 
     st.markdown(f"### 🍛 You Selected: **{selected_category}**")
 
-    # Filter Data
-    filtered_df = df[df["category"] == selected_category]
+    # Look Up the Category (prebuilt when the catalog loads - no DataFrame scan)
+    category_items = catalog.by_category[selected_category]
+    item_names = catalog.names_by_category[selected_category]
 
-    # Food Search Section
+    # Food Search Section (whole menu, typo tolerant - only the matches go to the browser)
     st.markdown("## 🔍 Find Your Favorite Dish")
-    selected_item = st.selectbox("Search for a food item:", ["Select an item"] + filtered_df["name"].tolist())
+    query = st.text_input("Search for a food item:", placeholder="e.g. biryani, chicken, cake")
+    selected_item = "Select an item"
+    if query.strip():
+        # The index is shared and kept current, so skip anything newer than this rerun's catalog
+        matches = [m for m in get_search_index(catalog).search(query, k=SEARCH_RESULTS) if m.name in catalog.by_name]
+        if matches:
+            selected_item = st.selectbox(
+                f"{len(matches)} matching dishes:",
+                ["Select an item", *(item.name for item in matches)],
+                format_func=lambda name: name if name == "Select an item" else f"{name} ({catalog.by_name[name].category})",
+            )
+        else:
+            st.info(f"😕 No dishes match '{query}'.")
 
     if selected_item != "Select an item":
-        item_info = filtered_df[filtered_df["name"] == selected_item].iloc[0]
+        item_info = catalog.by_name[selected_item]
         st.success(f"✅ {selected_item} Selected!")
-        st.markdown(f"**🍽️ {item_info['name']}** - **{item_info['price']}**")
-        st.markdown(f"_{item_info['desc']}_")
+        st.markdown(f"**🍽️ {item_info.name}** - **{item_info.price}**{vendor_credit(item_info)}")
+        st.markdown(f"_{item_info.desc}_")
 
     # Recommendations
     st.markdown("---")
     st.markdown("## 🔥 Curated for You ")
-    rec_option = st.radio("Choose recommendation type:", ["Randomized", "Top Rated"])
-
-    recommendations = filtered_df.to_dict(orient="records")
-
-    if rec_option == "Randomized":
-        recs = random.sample(recommendations, min(3, len(recommendations)))
+    rec_option = st.radio("Choose recommendation type:", ["Recommended for You", "Randomized", "Top Rated"])
+
+    if rec_option == "Recommended for You":
+        # Seed with the cart plus whatever the user just looked up
+        seed_ids = get_cart().item_ids()
+        if selected_item != "Select an item":
+            seed_ids.append(catalog.by_name[selected_item].item_id)
+        recs = get_recommender(catalog).recommend(selected_category, seed_ids, k=3)
+        if len(recs) < 3:
+            # Not enough similar dishes yet - top up with the best rated ones
+            taken = {item.item_id for item in recs} | set(seed_ids)
+            for item in top_rated(catalog).ordered(selected_category, TOP_RATED_SCORE):
+                if len(recs) == 3:
+                    break
+                if item.item_id not in taken:
+                    recs.append(item)
+        if not seed_ids:
+            st.caption("🛒 Add dishes to your cart to personalize these picks.")
+    elif rec_option == "Randomized":
+        recs = random.sample(category_items, min(3, len(category_items)))
     else:
-        recs = sorted(recommendations, key=lambda x: float(str(x["price"]).replace("$", "")), reverse=True)[:3]
+        recs = top_rated(catalog).top(selected_category, by=TOP_RATED_SCORE, k=3)
 
     cols = st.columns(3)
     for i, item in enumerate(recs):
         with cols[i]:
             st.markdown(f"""
                 <div class="card">
-                    <h4>🍽️ {item['name']} - {item['price']}</h4>
-                    <p>{item['desc']}</p>
+                    <h4>🍽️ {html.escape(item.name)} - {item.price}{vendor_credit(item)}</h4>
+                    <p>{html.escape(item.desc)}</p>
                 </div>
             """, unsafe_allow_html=True)
 
     # Food Ordering Section
     st.markdown("---")
     st.markdown("## 🛒 Order Your Favorite Food")
-    selected_food = st.selectbox("Choose a food item to order:", ["Select an item"] + filtered_df["name"].tolist())
+    selected_food = st.selectbox("Choose a food item to order:", ["Select an item", *item_names])
 
     if selected_food != "Select an item":
-        selected_item = next((item for item in recommendations if item["name"] == selected_food), None)
-        if selected_item:
-            st.markdown(f"### 🍛 {selected_item['name']} - **{selected_item['price']}**")
-            st.markdown(f"_{selected_item['desc']}_")
+        food = catalog.by_name.get(selected_food)
+        if food:
+            st.markdown(f"### 🍛 {food.name} - **{food.price}**{vendor_credit(food)}")
+            st.markdown(f"_{food.desc}_")
             if st.button("✅ Add to Cart"):
-                if "cart" not in st.session_state:
-                    st.session_state.cart = []
-                if selected_item in st.session_state.cart:
-                    st.warning(f"⚠️ {selected_item['name']} is already in your cart!")
+                quantity = get_cart().add(food.item_id, food.price_cents)
+                if quantity > 1:
+                    st.success(f"✅ Another {food.name} added - you now have {quantity} in your cart!")
                 else:
-                    st.session_state.cart.append(selected_item)
-                    st.success(f"✅ {selected_item['name']} added to cart!")
+                    st.success(f"✅ {food.name} added to cart!")
 
     # Go to Order Button
     if st.button("🛒 Go to Order"):
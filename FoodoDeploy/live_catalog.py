@@ -0,0 +1,236 @@
+import os
+import time
+import hashlib
+import threading
+
+import streamlit as st
+
+import db
+from migrations import migrate
+from catalog import CATALOG_PATH, Catalog, FoodItem, parse_price
+from ranking import get_rankings
+from recommend import get_recommender
+from reviews import ratings_version
+from search import get_search_index
+
+VENDOR_ITEM_COLUMNS = (
+    "SELECT vi.id, vi.item_name, vi.description, vi.item_price, vi.category, vi.vendor_id, v.username"
+    " FROM vendor_items vi JOIN vendor v ON v.id = vi.vendor_id"
+)
+CHECK_SECONDS = 1.0  # How often readers look at the menu file's fingerprint
+DIGEST_CHUNK = 1024 * 1024  # Bytes of the menu file hashed per read
+
+
+def vendor_item_id(row_id):
+    return f"v-{row_id}"
+
+
+def file_fingerprint(path):
+    """(mtime, size) of a file - cheap to take on every read, changes whenever the file is rewritten."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_digest(path):
+    """sha256 of a file's contents, read in chunks (hashlib.file_digest needs Python 3.11)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LiveCatalog:
+    """The house menu (food_data.csv) merged with vendor items, kept current without blocking readers.
+
+    current() always returns the last complete Catalog straight away; it
+    also notices when a source changed and starts the reload:
+
+    - Vendor items: SQLite bumps PRAGMA data_version for this connection
+      whenever another connection commits. Only the items listed in
+      catalog_changes since the last refresh are read back, and the new
+      Catalog is derived from the previous one with just those items
+      swapped in (shared indexes like search patch themselves).
+    - The menu file: its (mtime, size) fingerprint is checked at most every
+      CHECK_SECONDS. When it moves, a background thread re-reads the file,
+      compares a content hash (a touch alone reloads nothing) and rebuilds
+      the whole catalog. A file that fails to parse leaves the old menu up.
+
+    Either way the refresh runs on a background thread and builds the
+    catalog's shared indexes (search, recommendations, rankings) before the
+    new Catalog replaces the old one in a single assignment. Nobody waits:
+    until then every session keeps using the current catalog and its indexes.
+    """
+
+    def __init__(self, path=db.DB_PATH, csv_path=CATALOG_PATH):
+        self.path = path
+        self.csv_path = csv_path
+        self._conn = db.connect(path)  # Only reads after migrating - data_version ignores its own writes
+        migrate(self._conn)
+        self._lock = threading.Lock()  # Held while this connection or the vendor item state is in use
+        self._reloading = threading.Lock()  # Held by the background menu reload
+        self._next_check = 0.0
+        self._vendor_items = {}  # vendor_items.id -> FoodItem
+        self._taken_names = set()
+        self._seq = 0
+        self._data_version = None
+        # ✅ Metrics
+        self.refreshes = 0  # Incremental vendor item refreshes
+        self.items_reloaded = 0  # Vendor items re-read by those refreshes
+        self.refresh_seconds = 0.0
+        self.reloads = 0  # Full rebuilds after the menu file changed
+        self.reload_seconds = 0.0
+        self.last_reload_seconds = 0.0
+        self.reload_errors = 0
+        self.last_reload_error = None
+        self.refresh_errors = 0
+
+        self._fingerprint = file_fingerprint(csv_path)
+        self._digest = file_digest(csv_path)
+        self.base = Catalog.from_csv(csv_path)
+        self.catalog = self.base
+        with self._lock:
+            self._refresh(self.base)
+
+    def current(self):
+        """The latest complete Catalog. Never waits for a reload in progress."""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + CHECK_SECONDS
+            self._check_menu_file()
+        if self._lock.acquire(blocking=False):
+            try:
+                changed = self._conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version
+            except BaseException:
+                self._lock.release()
+                raise
+            if changed:  # The thread takes over the lock and releases it when done
+                threading.Thread(target=self._refresh_vendor_items, name="catalog-refresh", daemon=True).start()
+            else:
+                self._lock.release()
+        return self.catalog
+
+    def _refresh_vendor_items(self):
+        """Background thread: applies vendor item changes. Called with _lock held; releases it."""
+        try:
+            self._refresh()
+        except Exception:
+            self._data_version = None  # Try again on the next read
+            self.refresh_errors += 1
+        finally:
+            self._lock.release()
+
+    def _check_menu_file(self):
+        try:
+            fingerprint = file_fingerprint(self.csv_path)
+        except OSError:
+            return  # Mid-replace or gone - keep serving the menu we have
+        if fingerprint != self._fingerprint and self._reloading.acquire(blocking=False):
+            threading.Thread(target=self._reload, args=(fingerprint,), name="catalog-reload", daemon=True).start()
+
+    def _reload(self, fingerprint):
+        """Background thread: re-reads the menu file and swaps in a rebuilt catalog."""
+        start = time.perf_counter()
+        try:
+            digest = file_digest(self.csv_path)
+            if digest != self._digest:
+                base = Catalog.from_csv(self.csv_path)
+                with self._lock:
+                    self._refresh(base)
+                self._digest = digest
+                self.reloads += 1
+                self.last_reload_seconds = time.perf_counter() - start
+                self.reload_seconds += self.last_reload_seconds
+            self._fingerprint = fingerprint
+        except Exception as error:  # A half-written or malformed file - try again once it changes
+            self._fingerprint = fingerprint
+            self.reload_errors += 1
+            self.last_reload_error = f"{type(error).__name__}: {error}"
+        finally:
+            self._reloading.release()
+
+    def _refresh(self, base=None):
+        """Reads vendor item changes since the last refresh into a new catalog (call with _lock held).
+
+        Given a new base menu, re-reads every vendor item instead and builds
+        the catalog from scratch. The catalog goes live once its indexes are built.
+        """
+        start = time.perf_counter()
+        full = base is not None
+        since = 0 if full else self._seq
+        conn = self._conn
+        conn.execute("BEGIN")  # One snapshot for the version, the change log and the rows
+        try:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            changes = conn.execute(
+                "SELECT item_id, seq FROM catalog_changes WHERE seq > ? ORDER BY seq", (since,)
+            ).fetchall()
+            ids = [item_id for item_id, _ in changes]
+            rows = db.fetch_in(conn, f"{VENDOR_ITEM_COLUMNS} WHERE vi.id IN", ids)
+        finally:
+            conn.rollback()
+        self._data_version = data_version
+        if not changes and not full:
+            return
+
+        if full:
+            vendor_items, taken_names = {}, {item.name for item in base.items}
+        else:
+            base, vendor_items, taken_names = self.base, self._vendor_items, self._taken_names
+        upserted, removed = [], []
+        found = {row[0]: row for row in rows}
+        for row_id in ids:
+            old = vendor_items.pop(row_id, None)
+            if old is not None:
+                taken_names.discard(old.name)
+            row = found.get(row_id)
+            if row is not None:
+                item = vendor_item(row, taken_names)
+                vendor_items[row_id] = item
+                upserted.append(item)
+            elif old is not None:
+                removed.append(old.item_id)
+
+        previous = None if full else self.catalog
+        if previous is not None:
+            previous.derived_from = None  # Keep one step of history, not a chain of every old menu
+        catalog = Catalog.from_items(
+            (*base.items, *vendor_items.values()), derived_from=previous, upserted=upserted, removed=removed,
+        )
+        build_indexes(catalog, conn)
+        self.base, self._vendor_items, self._taken_names = base, vendor_items, taken_names
+        self._seq = changes[-1][1] if changes else since
+        self.catalog = catalog  # ✅ The swap - readers see the old catalog or the new one, never a mix
+        if not full:
+            self.refreshes += 1
+            self.items_reloaded += len(ids)
+            self.refresh_seconds += time.perf_counter() - start
+
+
+def build_indexes(catalog, conn):
+    """Builds (or patches) the shared indexes pages derive from a catalog, ready for its first reader."""
+    get_search_index(catalog)
+    get_recommender(catalog)
+    get_rankings(catalog, ratings_version(conn), conn)
+
+
+def vendor_item(row, taken_names):
+    """A vendor_items row as a FoodItem. Names clashing with another dish get the vendor's name added."""
+    row_id, name, description, price, category, vendor_id, vendor = row
+    if name in taken_names:
+        name = f"{name} ({vendor})"
+    if name in taken_names:
+        name = f"{name} #{row_id}"
+    taken_names.add(name)
+    return FoodItem(vendor_item_id(row_id), name, description, parse_price(price), category, 0.0, vendor_id, vendor)
+
+
+# ✅ One LiveCatalog per process
+@st.cache_resource
+def get_live_catalog():
+    return LiveCatalog()
+
+
+def load_catalog():
+    """The current menu (house items + vendor items), shared by every session and page."""
+    return get_live_catalog().current()
@@ -0,0 +1,277 @@
+import sys
+
+# ✅ Every schema change, in order. A migration is (version, name, steps), where each
+#    step is a SQL statement or a function taking the connection (for data changes).
+#    The database remembers the last version applied in PRAGMA user_version.
+#    Never edit a migration that has shipped - append a new one.
+#    Statements use IF NOT EXISTS so databases created before migrations existed upgrade cleanly.
+
+
+def _seed_discount_rules(conn):
+    """The codes the order page used to hardcode - only into an empty table."""
+    if conn.execute("SELECT COUNT(*) FROM discount_rules").fetchone()[0] == 0:
+        conn.executemany(
+            "INSERT INTO discount_rules (code, label, percent_off) VALUES (?, ?, ?)",
+            [
+                ("HALAL10", "HALAL10 (10% off)", 10),
+                ("FOODIE15", "FOODIE15 (15% off)", 15),
+                ("VIP20", "VIP20 (20% off)", 20),
+            ],
+        )
+
+
+def _backfill_sales_rollups(conn):
+    """Rolls up the orders written before the rollup tables existed (a one-off scan)."""
+    for table, bucket in (("vendor_sales_hourly", "hour"), ("vendor_sales_daily", "day")):
+        seconds = 3600 if bucket == "hour" else 86400
+        conn.execute(
+            f"INSERT OR IGNORE INTO {table} (vendor_id, {bucket}, orders, units, revenue_cents)"
+            f" SELECT l.vendor_id, CAST(o.placed_at / {seconds} AS INTEGER) * {seconds},"
+            " COUNT(DISTINCT o.id), SUM(l.quantity), SUM(l.quantity * l.unit_cents)"
+            " FROM order_lines l JOIN orders o ON o.id = l.order_id GROUP BY 1, 2"
+        )
+    conn.execute(
+        "INSERT OR IGNORE INTO vendor_item_sales_daily (vendor_id, day, item_id, name, units, revenue_cents)"
+        " SELECT l.vendor_id, CAST(o.placed_at / 86400 AS INTEGER) * 86400, l.item_id, MAX(l.name),"
+        " SUM(l.quantity), SUM(l.quantity * l.unit_cents)"
+        " FROM order_lines l JOIN orders o ON o.id = l.order_id GROUP BY 1, 2, 3"
+    )
+
+
+def _backfill_item_sales_hourly(conn):
+    """Rolls up per-item hourly sales for the orders written before the table existed."""
+    conn.execute(
+        "INSERT OR IGNORE INTO vendor_item_sales_hourly (vendor_id, hour, item_id, name, units, revenue_cents)"
+        " SELECT l.vendor_id, CAST(o.placed_at / 3600 AS INTEGER) * 3600, l.item_id, MAX(l.name),"
+        " SUM(l.quantity), SUM(l.quantity * l.unit_cents)"
+        " FROM order_lines l JOIN orders o ON o.id = l.order_id GROUP BY 1, 2, 3"
+    )
+
+
+MIGRATIONS = [
+    (1, "vendor accounts and items", [
+        """CREATE TABLE IF NOT EXISTS vendor (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Unique Vendor ID
+            username TEXT UNIQUE NOT NULL,         -- Unique Username
+            password TEXT NOT NULL                 -- Vendor Password
+        )""",
+        """CREATE TABLE IF NOT EXISTS vendor_items (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,  -- Unique Item ID
+            vendor_id INTEGER NOT NULL,            -- Reference to vendor.id
+            item_name TEXT NOT NULL,               -- Name of the food item
+            item_price REAL NOT NULL,              -- Price of the food item
+            FOREIGN KEY (vendor_id) REFERENCES vendor(id) ON DELETE CASCADE
+        )""",
+    ]),
+    (2, "index vendor items by vendor", [
+        "CREATE INDEX IF NOT EXISTS idx_vendor_items_vendor ON vendor_items (vendor_id)",
+    ]),
+    (3, "discount rules", [
+        """CREATE TABLE IF NOT EXISTS discount_rules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            code TEXT,                                   -- Coupon code; NULL = applied automatically
+            label TEXT NOT NULL,                         -- What the customer sees
+            vendor_id INTEGER,                           -- NULL = any vendor (0 = house menu)
+            category TEXT,                               -- NULL = any category
+            percent_off INTEGER NOT NULL DEFAULT 0,      -- Whole percent off the eligible lines
+            amount_off_cents INTEGER NOT NULL DEFAULT 0, -- Flat amount off once the rule applies
+            min_spend_cents INTEGER NOT NULL DEFAULT 0,  -- Eligible spend needed for the rule to apply
+            stackable INTEGER NOT NULL DEFAULT 0,        -- 1 = combines with other stackable rules
+            active INTEGER NOT NULL DEFAULT 1
+        )""",
+        _seed_discount_rules,
+    ]),
+    (4, "orders, order lines and status history", [
+        """CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            customer_id TEXT NOT NULL,                  -- Session-scoped customer id
+            placed_at REAL NOT NULL,                    -- Unix time
+            subtotal_cents INTEGER NOT NULL,
+            discount_cents INTEGER NOT NULL DEFAULT 0,
+            total_cents INTEGER NOT NULL,
+            codes TEXT NOT NULL DEFAULT '',             -- Comma-separated coupon codes used
+            status INTEGER NOT NULL DEFAULT 1           -- 1 = Order Received ... 4 = Delivered
+        )""",
+        """CREATE TABLE IF NOT EXISTS order_lines (
+            order_id INTEGER NOT NULL REFERENCES orders(id),
+            line_no INTEGER NOT NULL,
+            item_id TEXT NOT NULL,
+            vendor_id INTEGER NOT NULL,
+            name TEXT NOT NULL,                         -- Copied so old orders survive menu edits
+            quantity INTEGER NOT NULL,
+            unit_cents INTEGER NOT NULL,
+            PRIMARY KEY (order_id, line_no)
+        )""",
+        """CREATE TABLE IF NOT EXISTS order_events (
+            order_id INTEGER NOT NULL REFERENCES orders(id),
+            status INTEGER NOT NULL,
+            at REAL NOT NULL,                           -- Unix time the order reached this status
+            PRIMARY KEY (order_id, status)
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_orders_customer ON orders (customer_id, placed_at)",
+        "CREATE INDEX IF NOT EXISTS idx_order_lines_vendor ON order_lines (vendor_id, order_id)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_in_flight ON orders (id) WHERE status < 4",
+    ]),
+    (5, "cover vendor item counts and totals", [
+        "CREATE INDEX IF NOT EXISTS idx_vendor_items_vendor_price ON vendor_items (vendor_id, item_price)",
+    ]),
+    (6, "vendor items on the menu, with a change log", [
+        "ALTER TABLE vendor_items ADD COLUMN category TEXT NOT NULL DEFAULT 'Vendor Specials'",
+        "ALTER TABLE vendor_items ADD COLUMN description TEXT NOT NULL DEFAULT ''",
+        # One row per vendor item ever touched, holding the sequence number of its latest change.
+        # Readers ask for seq > the last one they saw; the table never grows past one row per item.
+        """CREATE TABLE IF NOT EXISTS catalog_changes (
+            item_id INTEGER PRIMARY KEY,                -- vendor_items.id (may no longer exist)
+            seq INTEGER NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_catalog_changes_seq ON catalog_changes (seq)",
+        "INSERT OR IGNORE INTO catalog_changes (item_id, seq) SELECT id, id FROM vendor_items",  # Items already listed
+        """CREATE TRIGGER IF NOT EXISTS vendor_items_inserted AFTER INSERT ON vendor_items BEGIN
+            INSERT OR REPLACE INTO catalog_changes (item_id, seq)
+            VALUES (NEW.id, (SELECT COALESCE(MAX(seq), 0) + 1 FROM catalog_changes));
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS vendor_items_updated AFTER UPDATE ON vendor_items BEGIN
+            INSERT OR REPLACE INTO catalog_changes (item_id, seq)
+            VALUES (NEW.id, (SELECT COALESCE(MAX(seq), 0) + 1 FROM catalog_changes));
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS vendor_items_deleted AFTER DELETE ON vendor_items BEGIN
+            INSERT OR REPLACE INTO catalog_changes (item_id, seq)
+            VALUES (OLD.id, (SELECT COALESCE(MAX(seq), 0) + 1 FROM catalog_changes));
+        END""",
+    ]),
+    (7, "reviews and per-item rating aggregates", [
+        """CREATE TABLE IF NOT EXISTS reviews (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            item_id TEXT NOT NULL,                      -- Catalog item id (house or vendor item)
+            customer_id TEXT NOT NULL,                  -- Session-scoped customer id
+            author TEXT NOT NULL,                       -- Name the reviewer typed
+            rating INTEGER NOT NULL CHECK (rating BETWEEN 1 AND 5),
+            comment TEXT NOT NULL DEFAULT '',
+            created_at REAL NOT NULL                    -- Unix time
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_reviews_item ON reviews (item_id, id)",
+        # Kept in step with reviews by reviews.add_reviews, in the same transaction as the inserts
+        """CREATE TABLE IF NOT EXISTS review_aggregates (
+            item_id TEXT PRIMARY KEY,
+            review_count INTEGER NOT NULL DEFAULT 0,
+            rating_sum INTEGER NOT NULL DEFAULT 0,
+            stars_1 INTEGER NOT NULL DEFAULT 0,
+            stars_2 INTEGER NOT NULL DEFAULT 0,
+            stars_3 INTEGER NOT NULL DEFAULT 0,
+            stars_4 INTEGER NOT NULL DEFAULT 0,
+            stars_5 INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID""",
+    ]),
+    (8, "vendor sales rollups", [
+        # Kept up to date by analytics.record_sales, in the same transaction as each order.
+        # Buckets are the Unix time the UTC hour / day starts.
+        """CREATE TABLE IF NOT EXISTS vendor_sales_hourly (
+            vendor_id INTEGER NOT NULL,
+            hour INTEGER NOT NULL,
+            orders INTEGER NOT NULL DEFAULT 0,
+            units INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0,   -- Line totals before order-level discounts
+            PRIMARY KEY (vendor_id, hour)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS vendor_sales_daily (
+            vendor_id INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            orders INTEGER NOT NULL DEFAULT 0,
+            units INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (vendor_id, day)
+        ) WITHOUT ROWID""",
+        """CREATE TABLE IF NOT EXISTS vendor_item_sales_daily (
+            vendor_id INTEGER NOT NULL,
+            day INTEGER NOT NULL,
+            item_id TEXT NOT NULL,
+            name TEXT NOT NULL,                         -- Latest name the item was sold under
+            units INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (vendor_id, day, item_id)
+        ) WITHOUT ROWID""",
+        _backfill_sales_rollups,
+    ]),
+    (9, "hourly per-item sales rollup", [
+        # Top items for windows shorter than a day (analytics.top_items)
+        """CREATE TABLE IF NOT EXISTS vendor_item_sales_hourly (
+            vendor_id INTEGER NOT NULL,
+            hour INTEGER NOT NULL,
+            item_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            units INTEGER NOT NULL DEFAULT 0,
+            revenue_cents INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (vendor_id, hour, item_id)
+        ) WITHOUT ROWID""",
+        _backfill_item_sales_hourly,
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn, migrations=MIGRATIONS):
+    """Applies every migration newer than the database, each in its own transaction.
+
+    Runs online: BEGIN IMMEDIATE only blocks other writers (WAL readers carry
+    on), and the version is re-read under that lock, so several processes
+    starting at once apply each migration exactly once. Returns the version
+    the database ends up at.
+    """
+    for version, name, steps in migrations:
+        if schema_version(conn) >= version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if schema_version(conn) >= version:  # Another process got there first
+                conn.rollback()
+                continue
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return schema_version(conn)
+
+
+def query_plan(conn, sql):
+    """The EXPLAIN QUERY PLAN detail lines for a statement (parameters bound to NULL)."""
+    params = (None,) * sql.count("?")
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def unindexed_queries(conn, queries):
+    """(sql, plan) for every query whose plan scans a whole table instead of searching an index."""
+    offenders = []
+    for sql in queries:
+        plan = query_plan(conn, sql)
+        if any(detail.startswith("SCAN") for detail in plan):
+            offenders.append((sql, plan))
+    return offenders
+
+
+# ✅ python migrations.py          - bring vendor.db up to date
+#    python migrations.py --check  - also verify the hot queries all use an index
+if __name__ == "__main__":
+    import db
+    import vendors
+
+    connection = db.connect()
+    print(f"✅ Schema at version {migrate(connection)} (latest {LATEST_VERSION})")
+    if "--check" in sys.argv:
+        offenders = unindexed_queries(connection, vendors.HOT_QUERIES)
+        for sql, plan in offenders:
+            print(f"❌ {sql}\n   {'; '.join(plan)}")
+        if offenders:
+            sys.exit(1)
+        print(f"✅ All {len(vendors.HOT_QUERIES)} hot queries use an index")
+    connection.close()
@@ -0,0 +1,198 @@
+import time
+import uuid
+import queue
+import atexit
+import sqlite3
+import threading
+from concurrent import futures
+from typing import NamedTuple
+
+import streamlit as st
+
+import db
+from analytics import record_sales
+from migrations import migrate
+
+MAX_BATCH = 256  # Orders committed together in one transaction at most
+SUBMIT_TIMEOUT = 10  # Seconds a checkout waits for its order to be committed
+
+
+class OrderLine(NamedTuple):
+    item_id: str
+    vendor_id: int
+    name: str
+    quantity: int
+    unit_cents: int
+
+
+class StatusChange(NamedTuple):
+    order_id: int
+    status: int
+    at: float
+
+
+class NewOrder(NamedTuple):
+    customer_id: str
+    subtotal_cents: int
+    discount_cents: int
+    total_cents: int
+    codes: tuple
+    lines: tuple  # OrderLine, ...
+
+
+def _insert_order(conn, order, placed_at):
+    cursor = conn.execute(
+        "INSERT INTO orders (customer_id, placed_at, subtotal_cents, discount_cents, total_cents, codes)"
+        " VALUES (?, ?, ?, ?, ?, ?)",
+        (order.customer_id, placed_at, order.subtotal_cents, order.discount_cents,
+         order.total_cents, ",".join(order.codes)),
+    )
+    order_id = cursor.lastrowid
+    conn.executemany(
+        "INSERT INTO order_lines (order_id, line_no, item_id, vendor_id, name, quantity, unit_cents)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(order_id, line_no, *line) for line_no, line in enumerate(order.lines, 1)],
+    )
+    conn.execute("INSERT INTO order_events (order_id, status, at) VALUES (?, 1, ?)", (order_id, placed_at))
+    record_sales(conn, order.lines, placed_at)
+    return order_id
+
+
+def _record_status_changes(conn, changes):
+    conn.executemany("UPDATE orders SET status = ? WHERE id = ?", [(c.status, c.order_id) for c in changes])
+    conn.executemany("INSERT OR REPLACE INTO order_events (order_id, status, at) VALUES (?, ?, ?)", changes)
+    return len(changes)
+
+
+class OrderWriter:
+    """The single writer for orders: one thread, one connection, group commit.
+
+    Checkouts call submit() from any session thread and get a Future back
+    (status updates from the order tracker go through the same queue). The
+    writer thread takes whatever has queued up while the previous transaction
+    was committing (up to MAX_BATCH orders) and writes it as one transaction,
+    so many concurrent checkouts share a single fsync instead of fighting over
+    the database lock. If a batch fails, its orders are retried one by one so
+    a bad order cannot take the others down with it.
+    """
+
+    def __init__(self, path=db.DB_PATH):
+        self.path = path
+        self._queue = queue.Queue()
+        self._stopped = False
+        self.batches = 0
+        self.orders_written = 0
+        # ✅ Connect and migrate before the thread starts: once get_order_writer() returns, the
+        #    order tables exist, so a reader on a fresh database never finds them missing.
+        self._conn = self._connect()
+        self._thread = threading.Thread(target=self._run, name="order-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, job):
+        """Queues a NewOrder or a tuple of StatusChanges.
+
+        The Future resolves once the job is committed - to the order id for a
+        NewOrder, to the number of changes otherwise.
+        """
+        if self._stopped:
+            raise RuntimeError("Order writer is closed")
+        future = futures.Future()
+        self._queue.put((job, future))
+        return future
+
+    def place(self, order, timeout=SUBMIT_TIMEOUT):
+        """Submits an order and waits for it to be durable. Returns the order id.
+
+        If the order is still queued after `timeout` it is withdrawn and
+        TimeoutError is raised - it will never be written, so trying again
+        cannot duplicate it. An order the writer has already started on is
+        waited for instead: its transaction is about to commit or fail.
+        """
+        future = self.submit(order)
+        try:
+            return future.result(timeout)
+        except futures.TimeoutError:  # Not the builtin TimeoutError before Python 3.11
+            if future.cancel():
+                raise TimeoutError("Order not written in time - withdrawn") from None
+            return future.result()
+
+    def close(self):
+        """Writes everything already queued, then stops the writer thread."""
+        if not self._stopped:
+            self._stopped = True
+            self._queue.put(None)
+            self._thread.join()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")  # Group commit makes the fsync per batch affordable
+        conn.execute("PRAGMA busy_timeout=5000")
+        migrate(conn)
+        return conn
+
+    def _run(self):
+        conn = self._conn
+        try:
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                batch = [first]
+                stop = False
+                while len(batch) < MAX_BATCH:
+                    try:
+                        entry = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if entry is None:
+                        stop = True
+                        break
+                    batch.append(entry)
+                # ✅ Claim each job before writing it; jobs their submitter withdrew are dropped
+                batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+                if batch:
+                    self._write(conn, batch)
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+    def _write(self, conn, batch):
+        placed_at = time.time()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            results = [
+                _insert_order(conn, job, placed_at) if isinstance(job, NewOrder) else _record_status_changes(conn, job)
+                for job, _ in batch
+            ]
+            conn.execute("COMMIT")
+        except Exception as error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            if len(batch) > 1:
+                for entry in batch:
+                    self._write(conn, [entry])
+            else:
+                batch[0][1].set_exception(error)
+            return
+        self.batches += 1
+        self.orders_written += sum(isinstance(job, NewOrder) for job, _ in batch)
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+# ✅ One writer per process, flushed on shutdown
+@st.cache_resource
+def get_order_writer():
+    writer = OrderWriter()
+    atexit.register(writer.close)
+    return writer
+
+
+def get_customer_id():
+    """A stable id for this browser session, used to look up its orders."""
+    if "customer_id" not in st.session_state:
+        st.session_state.customer_id = uuid.uuid4().hex
+    return st.session_state.customer_id
+
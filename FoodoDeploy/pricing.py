@@ -0,0 +1,117 @@
+import itertools
+from typing import NamedTuple
+
+import numpy as np
+import streamlit as st
+
+import db
+
+ANY = -1  # Rule column value meaning "matches every vendor / category"
+
+RULE_COLUMNS = "id, code, label, vendor_id, category, percent_off, amount_off_cents, min_spend_cents, stackable"
+
+
+def load_rules(conn):
+    """All active rules as tuples in RULE_COLUMNS order."""
+    return conn.execute(f"SELECT {RULE_COLUMNS} FROM discount_rules WHERE active = 1 ORDER BY id").fetchall()
+
+
+class PricingResult(NamedTuple):
+    subtotal_cents: int
+    discount_cents: int
+    total_cents: int
+    applied: tuple  # ((label, cents), ...) for every rule that gave money off
+
+
+class PricingEngine:
+    """Discount rules compiled into numpy columns plus lookup indexes.
+
+    Automatic rules are indexed by (vendor, category) - with ANY as a wildcard
+    on either side - and coupon rules by code, so pricing a cart only looks at
+    rules that could match it. The candidates are then evaluated against all
+    cart lines at once in integer cents. Stackable rules add up. An exclusive
+    rule competes with the stack, and the customer gets whichever is larger.
+    """
+
+    def __init__(self, rules):
+        rules = list(rules)
+        self.rule_ids = np.array([rule[0] for rule in rules], dtype=np.int64)
+        self.labels = [rule[2] for rule in rules]
+        categories = sorted({rule[4] for rule in rules if rule[4] is not None})
+        self.category_index = {category: i for i, category in enumerate(categories)}
+
+        self.vendor = np.array([ANY if rule[3] is None else rule[3] for rule in rules], dtype=np.int64)
+        self.category = np.array(
+            [ANY if rule[4] is None else self.category_index[rule[4]] for rule in rules], dtype=np.int64
+        )
+        self.percent_off = np.array([rule[5] for rule in rules], dtype=np.int64)
+        self.amount_off = np.array([rule[6] for rule in rules], dtype=np.int64)
+        self.min_spend = np.array([rule[7] for rule in rules], dtype=np.int64)
+        self.stackable = np.array([bool(rule[8]) for rule in rules], dtype=bool)
+
+        # ✅ Indexes: coupon code -> rules, (vendor, category) -> automatic rules
+        by_code, automatic = {}, {}
+        for position, rule in enumerate(rules):
+            if rule[1]:
+                by_code.setdefault(rule[1], []).append(position)
+            else:
+                automatic.setdefault((int(self.vendor[position]), int(self.category[position])), []).append(position)
+        self.by_code = {code: np.array(p, dtype=np.int64) for code, p in by_code.items()}
+        self.automatic = {key: np.array(p, dtype=np.int64) for key, p in automatic.items()}
+        self.codes = {code: self.labels[positions[0]] for code, positions in self.by_code.items()}
+
+    def candidates(self, line_vendors, line_categories, codes=()):
+        """Positions of the rules that could apply to a cart with these vendors/categories and codes."""
+        vendor_keys = {ANY, *line_vendors}
+        category_keys = {ANY, *line_categories}
+        parts = [self.automatic[key] for key in itertools.product(vendor_keys, category_keys) if key in self.automatic]
+        parts.extend(self.by_code[code] for code in codes if code in self.by_code)
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(parts))
+
+    def price(self, lines, codes=()):
+        """Prices cart lines given as (quantity, unit_cents, vendor_id, category) tuples."""
+        if not lines:
+            return PricingResult(0, 0, 0, ())
+        quantity, unit_cents, vendors, categories = zip(*lines)
+        line_totals = np.asarray(quantity, dtype=np.int64) * np.asarray(unit_cents, dtype=np.int64)
+        subtotal = int(line_totals.sum())
+        line_vendors = np.asarray(vendors, dtype=np.int64)
+        # Categories no rule mentions can only match ANY - give them an index no rule uses
+        line_categories = np.array([self.category_index.get(c, -2) for c in categories], dtype=np.int64)
+
+        rules = self.candidates(set(line_vendors.tolist()), set(line_categories.tolist()), codes)
+        if len(rules) == 0:
+            return PricingResult(subtotal, 0, subtotal, ())
+
+        # ✅ One vectorized pass: which lines each candidate rule covers, and its money off
+        rule_vendor = self.vendor[rules][:, None]
+        rule_category = self.category[rules][:, None]
+        covers = ((rule_vendor == ANY) | (rule_vendor == line_vendors)) & (
+            (rule_category == ANY) | (rule_category == line_categories)
+        )
+        eligible = covers @ line_totals
+        discount = eligible * self.percent_off[rules] // 100 + self.amount_off[rules]
+        discount = np.minimum(discount, eligible)
+        discount[(eligible == 0) | (eligible < self.min_spend[rules])] = 0
+
+        stackable = self.stackable[rules]
+        stack_total = int(discount[stackable].sum())
+        exclusive = np.where(stackable, 0, discount)
+        best_exclusive = int(exclusive.argmax())
+
+        if exclusive[best_exclusive] > stack_total:
+            chosen = [best_exclusive]
+        else:
+            chosen = np.flatnonzero(stackable & (discount > 0)).tolist()
+        total_discount = min(int(discount[chosen].sum()), subtotal)
+        applied = tuple((self.labels[rules[i]], int(discount[i])) for i in chosen if discount[i] > 0)
+        return PricingResult(subtotal, total_discount, subtotal - total_discount, applied)
+
+
+# ✅ Compile the rules once per process; pick up rule edits within a few minutes
+@st.cache_resource(ttl=300)
+def get_pricing_engine():
+    with db.get_pool().connection() as conn:
+        return PricingEngine(load_rules(conn))
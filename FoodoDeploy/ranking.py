@@ -0,0 +1,85 @@
+import heapq
+
+import streamlit as st
+
+from reviews import rating_summaries
+
+RANKINGS_CACHE_ENTRIES = 4  # (catalog, ratings) versions kept
+
+
+def average_rating(item, ratings):
+    """The stored average for a reviewed dish, otherwise the rating from the menu file."""
+    summary = ratings.get(item.item_id)
+    return summary.average if summary else item.review
+
+
+def review_count(item, ratings):
+    summary = ratings.get(item.item_id)
+    return summary.count if summary else 0
+
+
+# ✅ Score functions: (item, ratings) -> sortable value, higher ranks first. `ratings` maps
+#    item ids to their RatingSummary from review_aggregates (reviewed dishes only).
+#    Ties fall back to the rating, then to menu order (sorts are stable).
+SCORES = {
+    "review": lambda item, ratings: (average_rating(item, ratings), review_count(item, ratings)),
+    "review_count": lambda item, ratings: (review_count(item, ratings), average_rating(item, ratings)),
+    "price": lambda item, ratings: (item.price_cents, average_rating(item, ratings)),
+}
+
+
+def stored_ratings(conn, catalog):
+    """{item_id: RatingSummary} for the catalog's reviewed dishes, read from review_aggregates."""
+    summaries = rating_summaries(conn, (item.item_id for item in catalog.items))
+    return {item_id: summary for item_id, summary in summaries.items() if summary.count}
+
+
+class Rankings:
+    """Per-category orderings of a catalog, precomputed for every score in SCORES.
+
+    top() with no filter is a slice of a prebuilt tuple - O(K). With a filter,
+    or a score that was not precomputed, it falls back to heap selection.
+    """
+
+    def __init__(self, catalog, ratings=None, scores=None):
+        self.catalog = catalog
+        self.ratings = dict(ratings or {})
+        self.scores = dict(scores or SCORES)
+        self._ordered = {}
+        for name, score in self.scores.items():
+            key = self._key(score)
+            for category, items in catalog.by_category.items():
+                self._ordered[(category, name)] = tuple(sorted(items, key=key, reverse=True))
+
+    def _key(self, score):
+        ratings = self.ratings
+        return lambda item: score(item, ratings)
+
+    def ordered(self, category, by="review"):
+        """The full precomputed ordering for a category (best first)."""
+        return self._ordered.get((category, by), ())
+
+    def top(self, category, by="review", k=3, where=None):
+        """Top-k items in a category by a score. `where` is an optional item -> bool filter."""
+        if where is None and (category, by) in self._ordered:
+            return self._ordered[(category, by)][:k]
+        score = self.scores[by]
+        items = self.catalog.by_category.get(category, ())
+        if where is not None:
+            items = filter(where, items)
+        return heapq.nlargest(k, items, key=self._key(score))
+
+
+# ✅ One Rankings per (catalog version, ratings version), shared by every session
+@st.cache_resource(max_entries=RANKINGS_CACHE_ENTRIES)
+def rankings(catalog_version, ratings_version, _catalog, _conn):
+    return Rankings(_catalog, stored_ratings(_conn, _catalog))
+
+
+def get_rankings(catalog, ratings_version, conn):
+    """Returns Rankings for this catalog, reusing the last build if nothing changed.
+
+    ratings_version is reviews.ratings_version(conn); when it moves, the
+    stored ratings are read again (through conn) and the orderings recomputed.
+    """
+    return rankings(catalog.version, ratings_version, catalog, conn)
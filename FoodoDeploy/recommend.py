@@ -0,0 +1,120 @@
+import re
+import math
+from collections import Counter
+
+import numpy as np
+import streamlit as st
+
+TOKEN_RE = re.compile(r"[a-z]+")
+STOP_WORDS = frozenset("a an and the with in of for on to or no by its is are from".split())
+NAME_WEIGHT = 2  # Words in the item name count double against words in the description
+RECOMMENDER_CACHE_ENTRIES = 2  # Catalog versions kept (each is a full build)
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) > 1 and token not in STOP_WORDS]
+
+
+class Recommender:
+    """Item-item content similarity over menu names + descriptions.
+
+    The TF-IDF matrix is stored row-normalized in CSR form (indptr/indices/data
+    numpy arrays), with rows grouped by category so each category is one
+    contiguous block. A query gathers the cart rows into a profile vector,
+    scores the category block against it in one vectorized pass, and picks
+    the best K with argpartition.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+        # ✅ Rows grouped by category (catalog.by_category keeps menu order inside a category)
+        self.items = []
+        self.category_rows = {}
+        for category, items in catalog.by_category.items():
+            start = len(self.items)
+            self.items.extend(items)
+            self.category_rows[category] = (start, len(self.items))
+        self.row_of = {item.item_id: row for row, item in enumerate(self.items)}
+
+        # ✅ Term counts per document, then the vocabulary and IDF weights
+        docs = []
+        document_frequency = Counter()
+        for item in self.items:
+            counts = Counter(tokenize(item.desc))
+            for token in tokenize(item.name):
+                counts[token] += NAME_WEIGHT
+            docs.append(counts)
+            document_frequency.update(counts.keys())
+        self.vocabulary = {token: col for col, token in enumerate(sorted(document_frequency))}
+        n_docs = len(docs)
+        idf = {token: math.log((1 + n_docs) / (1 + df)) + 1.0 for token, df in document_frequency.items()}
+
+        # ✅ Build CSR arrays, L2-normalizing each row so dot products are cosine similarities
+        indptr = np.zeros(n_docs + 1, dtype=np.int64)
+        indices, data = [], []
+        for row, counts in enumerate(docs):
+            weights = [(self.vocabulary[token], (1.0 + math.log(count)) * idf[token]) for token, count in counts.items()]
+            norm = math.sqrt(sum(weight * weight for _, weight in weights)) or 1.0
+            for col, weight in weights:
+                indices.append(col)
+                data.append(weight / norm)
+            indptr[row + 1] = len(indices)
+        self.indptr = indptr
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.float32)
+        # Row number of every stored value - lets one bincount sum a whole block
+        self.row_ids = np.repeat(np.arange(n_docs, dtype=np.int32), np.diff(indptr))
+
+    def profile(self, item_ids):
+        """Sum of the TF-IDF rows of the given items (a dense vector over the vocabulary)."""
+        profile = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for item_id in item_ids:
+            row = self.row_of.get(item_id)
+            if row is not None:
+                start, end = self.indptr[row], self.indptr[row + 1]
+                profile[self.indices[start:end]] += self.data[start:end]
+        return profile
+
+    def scores(self, category, profile):
+        """Cosine-style similarity of every item in a category to a profile vector."""
+        start, end = self.category_rows[category]
+        lo, hi = self.indptr[start], self.indptr[end]
+        weighted = self.data[lo:hi] * profile[self.indices[lo:hi]]
+        return np.bincount(self.row_ids[lo:hi] - start, weights=weighted, minlength=end - start)
+
+    def recommend(self, category, seed_ids, k=3):
+        """Top-k items in `category` most similar to the seed items (usually the cart).
+
+        Seeds themselves are never recommended. Returns [] when there is nothing
+        to go on (no known seeds, or no shared words with the category).
+        """
+        if category not in self.category_rows:
+            return []
+        profile = self.profile(seed_ids)
+        if not profile.any():
+            return []
+        start, end = self.category_rows[category]
+        scores = self.scores(category, profile)
+        for item_id in seed_ids:
+            row = self.row_of.get(item_id)
+            if row is not None and start <= row < end:
+                scores[row - start] = -1.0
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [self.items[start + i] for i in best if scores[i] > 0]
+
+
+# ✅ One Recommender per catalog version, shared by every session
+@st.cache_resource(max_entries=RECOMMENDER_CACHE_ENTRIES)
+def recommender(catalog_version, _catalog):
+    return Recommender(_catalog)
+
+
+def get_recommender(catalog):
+    """Returns the shared Recommender for this catalog, building it on first use."""
+    return recommender(catalog.version, catalog)
@@ -1,143 +1,132 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px  # ✅ Using Plotly for interactive visualizations
 import os
-import base64
-
-# ✅ Function to Convert Image to Base64
-def get_base64_image(image_path):
-    """Encodes an image in Base64 format for embedding in HTML."""
-    if not os.path.exists(image_path):
-        return None  # Return None if image not found
+import sqlite3
+import pandas as pd
+import db
+from assets import picture_html
+from live_catalog import load_catalog
+from orders import get_customer_id
+from reviews import STARS, Review, add_review, rating_summaries, rating_summary, ratings_version, recent_reviews
 
-    with open(image_path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
+RECENT_REVIEWS_SHOWN = 10
+CHART_TOP_N = 25  # Bars on the ratings chart before the rest are grouped as "Other"
+CHART_CACHE_ENTRIES = 64  # Figures kept (oldest versions drop out first)
 
 # ✅ Function to Display Header with Logo
 def header_with_logo():
     """Displays the review logo in the header."""
     logo_path = os.path.join("images", "reviewlogo.jpg")  # Ensure correct path
-    logo_base64 = get_base64_image(logo_path)
+    logo_html = picture_html(logo_path, "logo", "Review Logo")
 
-    if logo_base64:
+    if logo_html:
         st.markdown(f"""
-            <style>
-                .review-header {{
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 15px;
-                    background-color: rgb(5, 1, 1);
-                    padding: 15px;
-                    border-radius: 10px;
-                    box-shadow: 0px 2px 5px rgba(252, 252, 252, 0.86);
-                }}
-                .review-header img {{
-                    height: 60px;
-                    width: auto;
-                    border-radius: 5px;
-                }}
-                .review-header h1 {{
-                    color: white;
-                    font-size: 26px;
-                    font-weight: bold;
-                    margin: 0;
-                }}
-            </style>
-            <div class="review-header">
-                <img src="data:image/jpeg;base64,{logo_base64}" alt="Review Logo">
+            <div class="page-header">
+                {logo_html}
                 <h1>Food Reviews & Ratings</h1>
             </div>
         """, unsafe_allow_html=True)
     else:
         st.title("⭐ Food Reviews & Ratings")  # Fallback if logo is missing
 
-# ✅ Function to Set a Background Image
-def set_background(image_file):
-    """Sets a background image in Streamlit using custom CSS."""
-    with open(image_file, "rb") as f:
-        encoded_string = base64.b64encode(f.read()).decode()
-
-    page_bg_css = f"""
-    <style>
-    .stApp {{
-        background-image: url("data:image/jpeg;base64,{encoded_string}");
-        background-size: cover;
-        background-position: center;
-        background-repeat: no-repeat;
-    }}
-    </style>
-    """
-    st.markdown(page_bg_css, unsafe_allow_html=True)
-
-# ✅ Load food dataset
-@st.cache_data
-def load_data():
-    df = pd.read_csv("food_data.csv", encoding="utf-8")
-    df.columns = df.columns.str.strip().str.lower()  # Standardize column names
-    return df
+def ratings_frame(items, summaries, top_n=CHART_TOP_N):
+    """Chart rows (name, review, reviews) for a category's dishes.
 
-df = load_data()
+    Ratings come from the stored aggregates; dishes nobody has reviewed yet
+    show the rating from the menu file. Past top_n dishes, the most reviewed
+    top_n - 1 keep their own bar and the rest share one "Other" bar, so the
+    chart stays the same size however big the category grows.
+    """
+    rows = [(item.name, summaries[item.item_id].average or item.review, summaries[item.item_id].count)
+            for item in items]
+    if len(rows) > top_n:
+        rows.sort(key=lambda row: (-row[2], -row[1]))
+        rest = rows[top_n - 1:]
+        rows = rows[:top_n - 1] + [
+            (f"Other ({len(rest):,} dishes)", sum(row[1] for row in rest) / len(rest), sum(row[2] for row in rest))
+        ]
+    return pd.DataFrame(rows, columns=["name", "review", "reviews"])
+
+
+def ratings_chart(category, ratings):
+    return px.bar(ratings,
+                  x="name",  # ✅ Use 'name' for food items
+                  y="review",
+                  labels={"name": "Food Item", "review": "Review Ratings", "reviews": "Reviews"},
+                  title=f"📊 Review Distribution for {category}",
+                  hover_data=["reviews"],
+                  color="review",
+                  color_continuous_scale="Sunset")
+
+
+# ✅ One figure per (category, catalog version, ratings version), shared by every session.
+#    Typing in the feedback form reruns the page but finds the figure already built.
+@st.cache_resource(max_entries=CHART_CACHE_ENTRIES)
+def review_chart(category, catalog_version, version, _catalog):
+    items = _catalog.by_category[category]
+    with db.get_pool().connection() as conn:
+        summaries = rating_summaries(conn, (item.item_id for item in items))
+    return ratings_chart(category, ratings_frame(items, summaries))
 
 def review_page():
-    # ✅ Set Background Image
-    image_path = os.path.join(os.path.dirname(__file__), "images", "flas.jpg")
-    if os.path.exists(image_path):
-        set_background(image_path)
-
     # ✅ Display Header with Logo
     header_with_logo()
     st.markdown("")
     st.markdown("")
     # ✅ Select a category for histogram
-    categories = df["category"].unique().tolist()
+    catalog = load_catalog()
+    categories = list(catalog.categories)
     st.markdown("")
     selected_category = st.selectbox("📌 Choose a category:", categories)
+    items = catalog.by_category.get(selected_category, ())
 
-    # ✅ Filter data for selected category
-    filtered_df = df[df["category"] == selected_category]
-
-    # ✅ Show Bar Chart for Reviews
-    if not filtered_df.empty:
-        fig = px.bar(filtered_df,
-                     x="name",  # ✅ Use 'name' for food items
-                     y="review",
-                     labels={"name": "Food Item", "review": "Review Ratings"},
-                     title=f"📊 Review Distribution for {selected_category}",
-                     color="review",
-                     color_continuous_scale="Sunset")
-        st.plotly_chart(fig)
+    # ✅ Show Bar Chart for Reviews (built once per category and ratings version, then reused)
+    if items:
+        with db.get_pool().connection() as conn:
+            version = ratings_version(conn)
+        st.plotly_chart(review_chart(selected_category, catalog.version, version, catalog))
 
     # ✅ Collect User Reviews
     st.subheader("📝 Share Your Feedback")
 
-    if "reviews" not in st.session_state:
-        st.session_state.reviews = []
-
     name = st.text_input("Your Name")
-    food_item = st.selectbox("Select the Food Item", filtered_df["name"].unique().tolist() if not filtered_df.empty else [])
+    food_item = st.selectbox("Select the Food Item", [item.name for item in items])
     rating = st.slider("Rate Your Experience", 1, 5, 3)
     comment = st.text_area("Leave a Comment")
+    item = catalog.by_name.get(food_item) if food_item else None
 
     if st.button("Submit Review"):
-        if name.strip() and comment.strip() and food_item:
-            review = {"name": name, "food": food_item, "rating": rating, "comment": comment}
-            st.session_state.reviews.append(review)
-            st.success("Thank you for your feedback!")
-            st.rerun()
+        if name.strip() and comment.strip() and item:
+            try:
+                with db.get_pool().connection() as conn:
+                    add_review(conn, Review(item.item_id, get_customer_id(), name.strip(), rating, comment.strip()))
+            except (sqlite3.Error, TimeoutError):
+                st.error("❌ Could not save your review right now. Please try again.")
+            else:
+                st.success("Thank you for your feedback!")
+                st.rerun()
         else:
             st.warning("Please fill out all fields before submitting.")
 
-    # ✅ Show User Submitted Reviews
-    if st.session_state.reviews:
-        st.subheader("📢 User Reviews")
-        for review in st.session_state.reviews:
-            st.markdown(f"""
-                **Review by {review['name']} on {review['food']}**  
-                ⭐ Rating: {review['rating']}/5  
-                💬 Comment: {review['comment']}
-            """)
-            st.divider()
+    # ✅ Show Reviews for the Selected Dish (everyone's, newest first)
+    if item:
+        with db.get_pool().connection() as conn:
+            summary = rating_summary(conn, item.item_id)
+            latest = recent_reviews(conn, item.item_id, limit=RECENT_REVIEWS_SHOWN) if summary.count else ()
+        if summary.count:
+            st.subheader(f"📢 User Reviews for {item.name}")
+            st.markdown(f"⭐ **{summary.average:.1f}/5** from {summary.count:,} reviews")
+            st.bar_chart(
+                pd.DataFrame({"Reviews": summary.histogram}, index=[f"{stars}★" for stars in STARS]),
+                horizontal=True,
+            )
+            for author, stars, text, _ in latest:
+                st.markdown(f"""
+                    **Review by {author}**  
+                    ⭐ Rating: {stars}/5  
+                    💬 Comment: {text}
+                """)
+                st.divider()
 
 if __name__ == "__main__":
     review_page()
@@ -0,0 +1,111 @@
+import time
+from typing import NamedTuple
+
+import db
+
+STARS = (1, 2, 3, 4, 5)
+
+INSERT_REVIEW = (
+    "INSERT INTO reviews (item_id, customer_id, author, rating, comment, created_at) VALUES (?, ?, ?, ?, ?, ?)"
+)
+# ✅ Adds a batch's counts to an item's aggregate row (creating it on the first review)
+UPSERT_AGGREGATE = """
+    INSERT INTO review_aggregates (item_id, review_count, rating_sum, stars_1, stars_2, stars_3, stars_4, stars_5)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (item_id) DO UPDATE SET
+        review_count = review_count + excluded.review_count,
+        rating_sum = rating_sum + excluded.rating_sum,
+        stars_1 = stars_1 + excluded.stars_1,
+        stars_2 = stars_2 + excluded.stars_2,
+        stars_3 = stars_3 + excluded.stars_3,
+        stars_4 = stars_4 + excluded.stars_4,
+        stars_5 = stars_5 + excluded.stars_5
+"""
+AGGREGATE_COLUMNS = "item_id, review_count, rating_sum, stars_1, stars_2, stars_3, stars_4, stars_5"
+RECENT_REVIEWS = (
+    "SELECT author, rating, comment, created_at FROM reviews WHERE item_id = ? ORDER BY id DESC LIMIT ?"
+)
+
+
+class Review(NamedTuple):
+    item_id: str
+    customer_id: str
+    author: str
+    rating: int
+    comment: str
+    created_at: float = 0.0  # 0 = now
+
+
+class RatingSummary(NamedTuple):
+    count: int
+    total: int
+    histogram: tuple  # Reviews with 1, 2, 3, 4 and 5 stars
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count else None
+
+
+NO_RATINGS = RatingSummary(0, 0, (0,) * len(STARS))
+
+
+def add_reviews(conn, reviews):
+    """Stores reviews and folds them into their items' aggregates, all in one transaction.
+
+    The batch is summed per item in Python first, so each item's aggregate
+    row is updated once however many of its reviews are in the batch.
+    Raises ValueError (and stores nothing) if a rating is not 1-5.
+    """
+    now = time.time()
+    rows, totals = [], {}
+    for review in reviews:
+        rating = int(review.rating)
+        if rating not in STARS:
+            raise ValueError(f"Rating must be 1-5, got {review.rating!r}")
+        rows.append((review.item_id, review.customer_id, review.author, rating, review.comment,
+                     review.created_at or now))
+        total = totals.get(review.item_id)
+        if total is None:
+            total = totals[review.item_id] = [0] * (2 + len(STARS))
+        total[0] += 1
+        total[1] += rating
+        total[1 + rating] += 1
+    rows.sort(key=lambda row: row[0])  # Item order touches each idx_reviews_item page once per batch
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.executemany(INSERT_REVIEW, rows)
+        conn.executemany(UPSERT_AGGREGATE, [(item_id, *total) for item_id, total in totals.items()])
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return len(rows)
+
+
+def add_review(conn, review):
+    add_reviews(conn, (review,))
+
+
+def rating_summaries(conn, item_ids):
+    """{item_id: RatingSummary} for the given items - primary key lookups, never a scan of reviews."""
+    item_ids = list(item_ids)
+    summaries = dict.fromkeys(item_ids, NO_RATINGS)
+    for item_id, count, total, *histogram in db.fetch_in(
+        conn, f"SELECT {AGGREGATE_COLUMNS} FROM review_aggregates WHERE item_id IN", item_ids
+    ):
+        summaries[item_id] = RatingSummary(count, total, tuple(histogram))
+    return summaries
+
+
+def rating_summary(conn, item_id):
+    return rating_summaries(conn, (item_id,))[item_id]
+
+
+def ratings_version(conn):
+    """Changes whenever a review is added (the newest review id) - one B-tree lookup."""
+    return conn.execute("SELECT MAX(id) FROM reviews").fetchone()[0] or 0
+
+
+def recent_reviews(conn, item_id, limit=10):
+    """An item's newest reviews as (author, rating, comment, created_at) rows."""
+    return conn.execute(RECENT_REVIEWS, (item_id, limit)).fetchall()
@@ -0,0 +1,39 @@
+import time
+import importlib
+from typing import NamedTuple
+
+# ✅ Every ?page= route and the function that draws it. Page modules are imported the first
+#    time their route is requested, not when the app starts, so a slow or broken page only
+#    costs (or breaks) itself.
+
+
+class Route(NamedTuple):
+    module: str
+    view: str  # Name of the function in `module` that draws the page
+
+
+ROUTES = {
+    "Homepage": Route("homepage", "homepage"),
+    "Order": Route("order", "order_page"),
+    "Progress": Route("progress", "progress_page"),
+    "Review": Route("review", "review_page"),
+    "Vendor": Route("vendors", "vendor_page"),
+    "AboutUs": Route("about_us", "about_us_page"),
+}
+
+import_seconds = {}  # route -> time its module took to import (first request only)
+
+
+def load_page(route):
+    """The view function for a route (None if there is no such route).
+
+    Raises whatever the page module's import raised, e.g. ImportError for a
+    missing dependency; a failed import is tried again on the next request.
+    """
+    spec = ROUTES.get(route)
+    if spec is None:
+        return None
+    start = time.perf_counter()
+    module = importlib.import_module(spec.module)  # After the first import, a sys.modules lookup
+    import_seconds.setdefault(route, time.perf_counter() - start)
+    return getattr(module, spec.view)
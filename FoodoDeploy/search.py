@@ -0,0 +1,282 @@
+import re
+import heapq
+import bisect
+import threading
+from collections import Counter
+from itertools import islice
+
+import streamlit as st
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+MAX_EXPANSIONS = 32  # Vocabulary words a prefix may expand to (shortest first)
+MAX_FUZZY_WORDS = 5  # Close spellings tried for a word that matches nothing
+MIN_SIMILARITY = 0.3  # Trigram Dice similarity for a word to be a typo candidate
+MAX_SCAN = 2000  # Postings examined per query - bounds latency on very common words
+INDEX_CACHE_ENTRIES = 4  # Catalog versions kept (mostly one patched index under several keys)
+
+# ✅ Match tiers - lower is better
+EXACT, PREFIX, FUZZY = 0, 1, 2
+TIER_POINTS = {EXACT: 3.0, PREFIX: 2.0, FUZZY: 1.0}
+NAME_BONUS = 1.0  # Extra points when the word is in the item name, not just the description
+
+
+def words_of(text):
+    """Lower-cased words of a text. Bare numbers are not worth indexing."""
+    return [word for word in WORD_RE.findall(text.lower()) if not word.isdigit()]
+
+
+def trigrams(word):
+    padded = f"^{word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Optimal string alignment distance (swaps count as one edit), or limit + 1 once it is exceeded."""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class _TrieNode:
+    __slots__ = ("children", "is_word")
+
+    def __init__(self):
+        self.children = {}
+        self.is_word = False
+
+
+class SearchIndex:
+    """Typo-tolerant search over menu item names and descriptions.
+
+    Every distinct word goes into a prefix trie and a trigram index (both
+    vocabulary-sized). Each word has a posting list of items kept sorted
+    best-first (name hits, then rating), so the top matches come from a lazy
+    merge of a few posting lists rather than a scan of the catalog. Items can
+    be added and removed one at a time.
+    """
+
+    def __init__(self, items=()):
+        self._root = _TrieNode()
+        self._grams = {}  # trigram -> set of words
+        self._postings = {}  # word -> sorted [(not in name, -rating, name, item_id)]
+        self._items = {}  # item_id -> item
+        self._item_words = {}  # item_id -> (name words, all words)
+        self._lock = threading.RLock()
+        self._bulk_load(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def _bulk_load(self, items):
+        """Initial build: append every posting, then sort each list once (insort per item is quadratic)."""
+        with self._lock:
+            for item in items:
+                if item.item_id in self._items:
+                    self.remove(item.item_id)
+                name_words, all_words = self._index_item(item)
+                for word in all_words:
+                    postings = self._postings.get(word)
+                    if postings is None:
+                        postings = self._postings[word] = []
+                        self._add_word(word)
+                    postings.append(self._posting(item, word, name_words))
+            for postings in self._postings.values():
+                postings.sort()
+
+    def _index_item(self, item):
+        name_words = frozenset(words_of(item.name))
+        all_words = name_words | frozenset(words_of(item.desc))
+        self._items[item.item_id] = item
+        self._item_words[item.item_id] = (name_words, all_words)
+        return name_words, all_words
+
+    @staticmethod
+    def _posting(item, word, name_words):
+        """Posting entry, sorted on as-is: name hits first, then higher rating, then name."""
+        return (word not in name_words, -float(item.review), item.name, item.item_id)
+
+    # ✅ Incremental updates
+
+    def add(self, item):
+        """Indexes an item (anything with item_id, name, desc, review). Re-adding replaces it."""
+        with self._lock:
+            if item.item_id in self._items:
+                self.remove(item.item_id)
+            name_words, all_words = self._index_item(item)
+            for word in all_words:
+                postings = self._postings.get(word)
+                if postings is None:
+                    postings = self._postings[word] = []
+                    self._add_word(word)
+                bisect.insort(postings, self._posting(item, word, name_words))
+
+    def remove(self, item_id):
+        """Drops an item from the index. Unknown ids are ignored."""
+        with self._lock:
+            item = self._items.pop(item_id, None)
+            if item is None:
+                return
+            name_words, all_words = self._item_words.pop(item_id)
+            for word in all_words:
+                postings = self._postings[word]
+                entry = self._posting(item, word, name_words)
+                index = bisect.bisect_left(postings, entry)
+                if index < len(postings) and postings[index] == entry:
+                    del postings[index]
+                if not postings:
+                    del self._postings[word]
+                    self._remove_word(word)
+
+    def _add_word(self, word):
+        node = self._root
+        for char in word:
+            node = node.children.setdefault(char, _TrieNode())
+        node.is_word = True
+        for gram in trigrams(word):
+            self._grams.setdefault(gram, set()).add(word)
+
+    def _remove_word(self, word):
+        path = [self._root]
+        for char in word:
+            path.append(path[-1].children[char])
+        path[-1].is_word = False
+        # Prune branches that no longer lead to any word
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.is_word or node.children:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+        for gram in trigrams(word):
+            words = self._grams[gram]
+            words.discard(word)
+            if not words:
+                del self._grams[gram]
+
+    # ✅ Word matching
+
+    def _expand_prefix(self, prefix):
+        """Vocabulary words starting with prefix, shortest first (breadth-first walk of the trie)."""
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        found = []
+        level = [(prefix, node)]
+        while level and len(found) < MAX_EXPANSIONS:
+            next_level = []
+            for text, current in level:
+                if current.is_word:
+                    found.append(text)
+                    if len(found) == MAX_EXPANSIONS:
+                        break
+                next_level.extend((text + char, child) for char, child in sorted(current.children.items()))
+            level = next_level
+        return found
+
+    def _fuzzy_words(self, token):
+        """Vocabulary words spelled like token: trigram overlap finds candidates, edit distance confirms."""
+        grams = trigrams(token)
+        overlap = Counter()
+        for gram in grams:
+            overlap.update(self._grams.get(gram, ()))
+        max_edits = 1 if len(token) <= 4 else 2
+        scored = []
+        for word, shared in overlap.items():
+            # A padded word of n letters has (at most) n trigrams
+            similarity = 2.0 * shared / (len(grams) + len(word))
+            if similarity < MIN_SIMILARITY or abs(len(word) - len(token)) > max_edits:
+                continue
+            distance = edit_distance(token, word, max_edits)
+            if distance <= max_edits:
+                scored.append((-distance, similarity, word))
+        return [word for _, _, word in heapq.nlargest(MAX_FUZZY_WORDS, scored)]
+
+    def _match_token(self, token):
+        """{word: tier} for every vocabulary word a query token matches."""
+        matches = {}
+        for word in self._expand_prefix(token):
+            matches[word] = EXACT if word == token else PREFIX
+        if not matches:
+            for word in self._fuzzy_words(token):
+                matches[word] = FUZZY
+        return matches
+
+    # ✅ Querying
+
+    def search(self, query, k=10):
+        """Top-k items matching every word of the query (the last word may be a prefix)."""
+        tokens = list(dict.fromkeys(words_of(query)))
+        if not tokens or k <= 0:
+            return []
+        with self._lock:
+            token_matches = [self._match_token(token) for token in tokens]
+            if not all(token_matches):
+                return []
+
+            # Drive the scan from the token with the fewest postings, best tier first
+            driver = min(
+                range(len(tokens)),
+                key=lambda i: sum(len(self._postings[word]) for word in token_matches[i]),
+            )
+            scored = {}
+            for tier in (EXACT, PREFIX, FUZZY):
+                words = [word for word, t in token_matches[driver].items() if t == tier]
+                if not words:
+                    continue
+                merged = heapq.merge(*(self._postings[word] for word in words))
+                for *_, item_id in islice(merged, MAX_SCAN):
+                    if item_id not in scored:
+                        score = self._score(item_id, token_matches)
+                        if score is not None:
+                            scored[item_id] = score
+                    if len(scored) >= k * 4:
+                        break
+                if len(scored) >= k * 4:
+                    break
+
+            best = heapq.nlargest(k, scored.items(), key=lambda pair: pair[1])
+            return [self._items[item_id] for item_id, _ in best]
+
+    def _score(self, item_id, token_matches):
+        """Points for an item across all query tokens, or None if a token is not matched."""
+        name_words, all_words = self._item_words[item_id]
+        total = 0.0
+        for matches in token_matches:
+            best = None
+            for word in all_words.intersection(matches):
+                points = TIER_POINTS[matches[word]] + (NAME_BONUS if word in name_words else 0.0)
+                best = points if best is None else max(best, points)
+            if best is None:
+                return None
+            total += best
+        return total, float(self._items[item_id].review)
+
+
+# ✅ One SearchIndex per catalog version, shared by every session. A catalog derived from
+#    an earlier one reuses that version's index and re-indexes only the changed items.
+@st.cache_resource(max_entries=INDEX_CACHE_ENTRIES)
+def search_index(catalog_version, _catalog):
+    previous = _catalog.derived_from
+    if previous is None:
+        return SearchIndex(_catalog.items)
+    index = search_index(previous.version, previous)
+    for item_id in _catalog.removed:
+        index.remove(item_id)
+    for item in _catalog.upserted:
+        index.add(item)
+    return index
+
+
+def get_search_index(catalog):
+    """Returns the shared SearchIndex for this catalog, building it on first use."""
+    return search_index(catalog.version, catalog)
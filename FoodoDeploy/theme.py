@@ -0,0 +1,270 @@
+import os
+import re
+
+import streamlit as st
+
+import assets
+
+# ✅ The app's whole stylesheet. Pages only emit class names; this is built once per process,
+#    minified, published to static/css/ under a content hash and pulled in with a one-line
+#    @import, so each rerun sends a URL instead of the CSS and browsers cache the file.
+STYLESHEET = """
+/* Header / navigation bar (app.py) */
+.header {
+    background: #ffffff;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    padding: 15px 20px;
+    box-shadow: 0px 4px 10px rgba(0, 0, 0, 0.1);
+    position: sticky;
+    top: 0;
+    z-index: 100;
+    border-radius: 8px;
+}
+.header .logo img {
+    height: 55px;
+    width: auto;
+    object-fit: contain;
+}
+.header .menu {
+    display: flex;
+    gap: 15px;
+}
+.header .menu a {
+    background: #111;
+    color: white;
+    font-size: 18px;
+    font-weight: bold;
+    padding: 12px 22px;
+    border-radius: 6px;
+    text-decoration: none;
+    transition: all 0.3s ease-in-out;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+}
+.header .menu a:hover {
+    background: #333;
+    transform: scale(1.05);
+}
+
+/* Footer (app.py) */
+.footer {
+    text-align: center;
+    padding: 15px;
+    background: #333;
+    color: yellow;
+    width: 100%;
+    font-size: 14px;
+    margin-top: 50px;
+    border-radius: 8px;
+}
+.footer a {
+    color: #ffffff;
+    text-decoration: none;
+    font-weight: bold;
+    padding: 0 10px;
+}
+.footer a:hover {
+    text-decoration: underline;
+}
+
+/* Page background (every page) */
+.stApp {
+    background-repeat: no-repeat;
+    background-position: center center;
+    background-attachment: fixed;
+    background-size: cover;
+}
+
+/* Page title bar with logo (Order, Progress, Review, Vendor, About Us) */
+.page-header {
+    display: flex;
+    align-items: center;
+    justify-content: center;
+    gap: 15px;
+    background-color: rgb(5, 1, 1);
+    padding: 15px;
+    border-radius: 10px;
+    box-shadow: 0px 2px 5px rgba(252, 252, 252, 0.86);
+}
+.page-header img {
+    height: 60px;
+    width: auto;
+    border-radius: 5px;
+}
+.page-header h1 {
+    color: white;
+    font-size: 26px;
+    font-weight: bold;
+    margin: 0;
+}
+
+/* Homepage hero */
+.hero-container {
+    width: 100%;
+    height: 380px;
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    text-align: center;
+    color: white;
+    text-shadow: 3px 3px 10px rgba(0,0,0,0.8);
+    background-repeat: no-repeat;
+    background-position: center center;
+    background-size: cover;
+    border-radius: 15px;
+    position: relative;
+    box-shadow: 0px 2px 5px rgba(252, 252, 252, 0.86);
+}
+.hero-overlay {
+    position: absolute;
+    top: 0;
+    left: 0;
+    width: 100%;
+    height: 100%;
+    background: rgba(0, 0, 0, 0.6); /* Dark Overlay */
+    border-radius: 15px;
+}
+.hero-content {
+    position: relative;
+    z-index: 2;
+}
+.hero-content h1 {
+    font-size: 55px;
+    font-weight: bold;
+    margin-bottom: 15px;
+    color: #ffcc00; /* Gold */
+}
+.hero-content p {
+    font-size: 24px;
+    font-weight: 300;
+    color: white;
+    margin-bottom: 25px;
+}
+
+/* Homepage dish cards */
+.card {
+    background: #333;
+    padding: 20px;
+    border-radius: 12px;
+    box-shadow: 0 6px 15px rgba(0, 0, 0, 0.3);
+    transition: all 0.3s ease-in-out;
+    color: #ffcc00;
+    text-align: center;
+    cursor: pointer;
+}
+.card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 18px rgba(0, 0, 0, 0.5);
+}
+
+/* About Us team cards */
+.fade-in {
+    animation: fadeIn 1s;
+}
+.team-container {
+    display: flex;
+    flex-wrap: wrap;
+    justify-content: center;
+    gap: 50px;
+    padding: 20px;
+}
+.team-card {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    background: rgba(255, 255, 255, 0.85);
+    padding: 25px;
+    border-radius: 10px;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+    width: 300px;
+    text-align: center;
+    margin-bottom: 30px;
+    transition: transform 0.3s;
+}
+.team-card:hover {
+    transform: scale(1.05);
+    box-shadow: 0 8px 16px rgba(0,0,0,0.4);
+}
+.team-card img {
+    width: 150px;
+    height: 150px;
+    border-radius: 50%;
+    object-fit: cover;
+    margin-bottom: 20px;
+    border: 3px solid white;
+}
+.team-card h3 {
+    font-size: 20px;
+    color: #333;
+    margin: 8px 0;
+}
+.team-card p {
+    font-size: 15px;
+    color: #555;
+    margin: 5px 0;
+}
+"""
+
+# ✅ Background images, as (CSS selector, image, display slot)
+BACKGROUND_IMAGES = (
+    (".stApp", "flas.jpg", "background"),
+    (".hero-container", "flside.jpeg", "hero"),
+)
+
+STATIC_CSS_DIR = os.path.join(assets.STATIC_DIR, "css")
+STATIC_CSS_URL = assets.STATIC_URL + "/css"
+
+
+def minify(css):
+    """Drops comments and the whitespace CSS does not need."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def stylesheet_url(url):
+    """An image URL as seen from static/css/ (data: URIs pass through)."""
+    prefix = assets.STATIC_URL + "/"
+    return "../" + url[len(prefix):] if url.startswith(prefix) else url
+
+
+def background_rules():
+    """background-image rules for the page images that exist (WebP first where there is one)."""
+    rules = []
+    for selector, image, slot in BACKGROUND_IMAGES:
+        webp_url, fallback_url = assets.slot_image_urls(os.path.join(assets.IMAGES_DIR, image), slot)
+        if fallback_url is None:
+            continue  # Missing image - that element just goes without a background
+        css = f'background-image: url("{stylesheet_url(fallback_url)}");'
+        if webp_url:
+            css += (f' background-image: image-set(url("{stylesheet_url(webp_url)}") type("image/webp"),'
+                    f' url("{stylesheet_url(fallback_url)}"));')
+        rules.append(f"{selector} {{ {css} }}")
+    return "\n".join(rules)
+
+
+def build_stylesheet():
+    return minify(STYLESHEET + background_rules())
+
+
+# ✅ Built once per process. Returns the markup each rerun sends: an @import of the
+#    published file, or (without static serving) the minified CSS itself.
+@st.cache_resource
+def theme_markup():
+    css = build_stylesheet()
+    if assets.static_serving_enabled():
+        try:
+            url = assets.StaticPublisher(STATIC_CSS_DIR, STATIC_CSS_URL).publish("theme", ".css", css.encode())
+        except OSError:
+            url = None  # Read-only deploy - inline instead
+        if url is not None:
+            return f'<style>@import url("{url}");</style>'
+    css = css.replace('url("../', f'url("{assets.STATIC_URL}/')
+    return f"<style>{css}</style>"
+
+
+def apply_theme():
+    """Pulls in the app stylesheet. Call once at the top of every run (app.py does)."""
+    st.markdown(theme_markup(), unsafe_allow_html=True)
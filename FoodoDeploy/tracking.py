@@ -0,0 +1,151 @@
+import time
+import heapq
+import atexit
+import threading
+
+import streamlit as st
+
+import db
+from events import get_event_bus
+from orders import StatusChange, get_order_writer
+
+# ✅ Order lifecycle (stored in orders.status)
+RECEIVED, PREPARING, OUT_FOR_DELIVERY, DELIVERED = 1, 2, 3, 4
+STATUS_LABELS = {
+    RECEIVED: "🛒 Order Received",
+    PREPARING: "🍳 Preparing Your Food",
+    OUT_FOR_DELIVERY: "🚴 Out for Delivery",
+    DELIVERED: "✅ Delivered!",
+}
+# Seconds an order spends in each status before moving on
+STAGE_SECONDS = {RECEIVED: 20, PREPARING: 60, OUT_FOR_DELIVERY: 90}
+MAX_BATCH = 5000  # Transitions written in one transaction at most
+
+
+class OrderTracker:
+    """Moves stored orders through their lifecycle on a schedule, in the background.
+
+    Every in-flight order has exactly one pending transition in a heap ordered
+    by due time; a single thread sleeps until the earliest one is due, writes
+    all due transitions in one batch through the order writer, and schedules
+    each order's next step. Every committed transition is published to the
+    event bus under the order id, so sessions following an order hear about
+    it without querying anything. The current status of in-flight orders is
+    also kept in memory to seed new subscriptions.
+    In-flight orders are reloaded from the database on start, so a restart
+    picks up where it left off.
+    """
+
+    def __init__(self, writer, stage_seconds=None, pool=None, bus=None):
+        self.writer = writer
+        self.bus = bus
+        self.stage_seconds = dict(stage_seconds or STAGE_SECONDS)
+        self.pool = pool or db.get_pool()  # Reads of orders that are not in memory
+        self._due = []  # heap of (due_at, order_id, next_status)
+        self._state = {}  # in-flight order_id -> (status, since)
+        self._cond = threading.Condition()
+        self._stopped = False
+        self.transitions = 0
+        self.max_lag = 0.0  # Worst delay seen between a transition falling due and being picked up
+        self._resume()
+        self._thread = threading.Thread(target=self._run, name="order-tracker", daemon=True)
+        self._thread.start()
+
+    def _resume(self):
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT o.id, o.status, COALESCE(MAX(e.at), o.placed_at) FROM orders o"
+                " LEFT JOIN order_events e ON e.order_id = o.id AND e.status = o.status"
+                " WHERE o.status < ? GROUP BY o.id",
+                (DELIVERED,),
+            ).fetchall()
+        for order_id, status, since in rows:
+            self._schedule(order_id, status, since)
+
+    def _schedule(self, order_id, status, since):
+        """Records an order's current status and queues its next transition. Caller holds the lock."""
+        if status >= DELIVERED:
+            self._state.pop(order_id, None)
+            return
+        self._state[order_id] = (status, since)
+        heapq.heappush(self._due, (since + self.stage_seconds[status], order_id, status + 1))
+
+    def track(self, order_id, placed_at=None):
+        """Starts the lifecycle of a newly placed order. Orders already being tracked are left alone."""
+        with self._cond:
+            if order_id in self._state:
+                return
+            self._schedule(order_id, RECEIVED, time.time() if placed_at is None else placed_at)
+            self._cond.notify()
+
+    def status(self, order_id):
+        """(status, since) for an order, or None if there is no such order."""
+        state = self._state.get(order_id)
+        if state is not None:
+            return state
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT o.status, COALESCE(MAX(e.at), o.placed_at) FROM orders o"
+                " LEFT JOIN order_events e ON e.order_id = o.id AND e.status = o.status"
+                " WHERE o.id = ? GROUP BY o.id",
+                (order_id,),
+            ).fetchone()
+
+    def subscribe(self, order_id):
+        """A Subscription to an order's status changes, seeded with its current (status, since)."""
+        subscription = self.bus.subscribe(order_id)
+        state = self.status(order_id)  # Read after subscribing so no change can slip in between
+        if subscription.version == 0:
+            subscription.value = state
+        if state is None or state[0] >= DELIVERED:
+            self.bus.publish(order_id, state, final=True)  # Nothing more will happen - drop the topic
+        return subscription
+
+    def in_flight(self):
+        return len(self._state)
+
+    def close(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._stopped and (not self._due or self._due[0][0] > time.time()):
+                    self._cond.wait(None if not self._due else self._due[0][0] - time.time())
+                if self._stopped:
+                    return
+                now = time.time()
+                self.max_lag = max(self.max_lag, now - self._due[0][0])
+                changes = []
+                while self._due and self._due[0][0] <= now and len(changes) < MAX_BATCH:
+                    due_at, order_id, status = heapq.heappop(self._due)
+                    if self._state.get(order_id, (None,))[0] == status - 1:  # Skip stale entries
+                        changes.append(StatusChange(order_id, status, due_at))
+                if not changes:
+                    continue
+            try:
+                self.writer.submit(tuple(changes)).result()
+            except Exception:
+                # Put them back and try again shortly rather than losing transitions
+                with self._cond:
+                    for change in changes:
+                        heapq.heappush(self._due, (time.time() + 1, change.order_id, change.status))
+                continue
+            with self._cond:
+                for change in changes:
+                    self._schedule(change.order_id, change.status, change.at)
+                self.transitions += len(changes)
+            if self.bus is not None:
+                for change in changes:
+                    self.bus.publish(change.order_id, (change.status, change.at), final=change.status >= DELIVERED)
+
+
+# ✅ One tracker per process, sharing the order writer and publishing to the event bus
+@st.cache_resource
+def get_order_tracker():
+    tracker = OrderTracker(get_order_writer(), bus=get_event_bus())
+    atexit.register(tracker.close)
+    return tracker
@@ -0,0 +1,133 @@
+import io
+import csv
+import tempfile
+from typing import NamedTuple
+
+from catalog import parse_price
+
+try:  # ✅ Parquet support is optional - CSV always works
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+COLUMNS = ("item_name", "item_price")
+CHUNK_ROWS = 5000  # Rows validated and inserted per executemany call
+MAX_NAME_LENGTH = 100
+MIN_PRICE_CENTS, MAX_PRICE_CENTS = 100, 1_000_000  # Same floor as the Add Item form; $10k ceiling
+MAX_REPORTED_ERRORS = 100  # Row errors kept for display (all of them are counted)
+SPOOL_BYTES = 4 * 1024 * 1024  # Exports bigger than this spill from memory to a temp file
+
+INSERT_ITEMS = "INSERT INTO vendor_items (vendor_id, item_name, item_price) VALUES (?, ?, ?)"
+EXPORT_ITEMS = "SELECT item_name, item_price FROM vendor_items WHERE vendor_id=? ORDER BY id"
+
+
+class ImportResult(NamedTuple):
+    imported: int
+    error_count: int
+    errors: tuple  # ((line number, message), ...) - the first MAX_REPORTED_ERRORS
+
+
+def parse_item(row):
+    """(name, price in dollars) from a row dict, or ValueError explaining what is wrong."""
+    name = (row.get("item_name") or "").strip()
+    if not name:
+        raise ValueError("item_name is empty")
+    if len(name) > MAX_NAME_LENGTH:
+        raise ValueError(f"item_name is longer than {MAX_NAME_LENGTH} characters")
+    price = row.get("item_price")
+    if price is None or str(price).strip() == "":
+        raise ValueError("item_price is empty")
+    cents = parse_price(price)
+    if not MIN_PRICE_CENTS <= cents <= MAX_PRICE_CENTS:
+        raise ValueError(f"item_price must be between ${MIN_PRICE_CENTS / 100:.2f} and ${MAX_PRICE_CENTS / 100:,.2f}")
+    return name, cents / 100
+
+
+def read_csv_rows(file):
+    """(line number, row dict) for each data row of a binary CSV file, read incrementally."""
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
+        missing = [column for column in COLUMNS if column not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"Missing column(s): {', '.join(missing)}")
+        for row in reader:
+            yield reader.line_num, row
+    finally:
+        text.detach()  # Leave the caller's file open
+
+
+def read_parquet_rows(file):
+    """(row number, row dict) for each row of a Parquet file, one record batch at a time."""
+    if pq is None:
+        raise ValueError("Parquet import needs pyarrow (pip install pyarrow)")
+    parquet = pq.ParquetFile(file)
+    missing = [column for column in COLUMNS if column not in parquet.schema_arrow.names]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    number = 1  # Row 1 is the first data row, like line 2 of a CSV with a header
+    for batch in parquet.iter_batches(batch_size=CHUNK_ROWS, columns=list(COLUMNS)):
+        for row in batch.to_pylist():
+            number += 1
+            yield number, row
+
+
+def import_items(conn, vendor_id, rows):
+    """Validates and inserts (line number, row) pairs for a vendor in one transaction.
+
+    Rows are checked and inserted CHUNK_ROWS at a time with executemany, so
+    memory stays flat however large the file is. Bad rows are skipped and
+    reported; the good ones are committed together at the end (or not at all
+    if something unexpected fails).
+    """
+    imported, error_count, errors, chunk = 0, 0, [], []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for line, row in rows:
+            try:
+                name, price = parse_item(row)
+            except ValueError as error:
+                error_count += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append((line, str(error)))
+                continue
+            chunk.append((vendor_id, name, price))
+            if len(chunk) >= CHUNK_ROWS:
+                conn.executemany(INSERT_ITEMS, chunk)
+                imported += len(chunk)
+                chunk.clear()
+        if chunk:
+            conn.executemany(INSERT_ITEMS, chunk)
+            imported += len(chunk)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return ImportResult(imported, error_count, tuple(errors))
+
+
+def iter_export_csv(conn, vendor_id):
+    """A vendor's items as CSV bytes, one chunk per CHUNK_ROWS rows (same columns import expects)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    cursor = conn.execute(EXPORT_ITEMS, (vendor_id,))
+    while True:
+        rows = cursor.fetchmany(CHUNK_ROWS)
+        if not rows:
+            break
+        writer.writerows((name, f"{price:.2f}") for name, price in rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_file(conn, vendor_id):
+    """The CSV export in a file object - kept in memory when small, spilled to disk when large."""
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    for chunk in iter_export_csv(conn, vendor_id):
+        out.write(chunk)
+    out.seek(0)
+    return out
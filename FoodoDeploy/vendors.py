@@ -1,121 +1,73 @@
 import streamlit as st
 import sqlite3
+import csv
 import os
-import base64
-
-# ✅ Function to Convert Image to Base64
-def get_base64_image(image_path):
-    """Encodes an image in Base64 format for embedding in HTML."""
-    if not os.path.exists(image_path):
-        return None  # Return None if image not found
-    
-    with open(image_path, "rb") as f:
-        return base64.b64encode(f.read()).decode()
-
-# ✅ Function to Set a Background Image
-def set_background(image_file):
-    """Sets a background image in Streamlit using custom CSS."""
-    encoded_string = get_base64_image(image_file)
-    
-    if encoded_string:
-        page_bg_css = f"""
-        <style>
-        .stApp {{
-            background: url("data:image/jpeg;base64,{encoded_string}") no-repeat center center fixed;
-            background-size: cover;
-        }}
-        </style>
-        """
-        st.markdown(page_bg_css, unsafe_allow_html=True)
-    else:
-        st.error(f"⚠️ Background image not found: {image_file}")
+import pandas as pd
+import db
+import auth
+import analytics
+import vendor_io
+from catalog import VENDOR_CATEGORY
+from live_catalog import load_catalog
+from assets import picture_html
+
+# ✅ SQL used by the page (the schema itself lives in migrations.py)
+REGISTER_VENDOR = "INSERT INTO vendor (username, password) VALUES (?, ?)"
+LOGIN_VENDOR = "SELECT id, password FROM vendor WHERE username=?"
+UPDATE_PASSWORD = "UPDATE vendor SET password=? WHERE id=?"
+ADD_ITEM = "INSERT INTO vendor_items (vendor_id, item_name, item_price, category, description) VALUES (?, ?, ?, ?, ?)"
+# Keyset pagination: each page starts after the last id of the previous one, so any page costs the same
+LIST_ITEMS = "SELECT id, item_name, item_price FROM vendor_items WHERE vendor_id=? AND id>? ORDER BY id LIMIT ?"
+FIND_ITEMS = (
+    "SELECT id, item_name, item_price FROM vendor_items"
+    " WHERE vendor_id=? AND id>? AND item_name LIKE ? ESCAPE '\\' ORDER BY id LIMIT ?"
+)
+ITEM_SUMMARY = "SELECT COUNT(*), COALESCE(SUM(item_price), 0) FROM vendor_items WHERE vendor_id=?"
+REMOVE_ITEM = "DELETE FROM vendor_items WHERE id=?"
+# Run on every rerun or click - `python migrations.py --check` verifies each one uses an index
+HOT_QUERIES = (
+    LOGIN_VENDOR, LIST_ITEMS, FIND_ITEMS, ITEM_SUMMARY, REMOVE_ITEM,
+    analytics.HOURLY_SALES, analytics.DAILY_SALES, analytics.TOP_SELLERS_HOURLY, analytics.TOP_SELLERS,
+)
+PAGE_SIZES = [10, 25, 50, 100]
 
 # ✅ Function to Display Header with Logo
 def header_with_logo():
     """Displays the vendor logo in the header."""
     logo_path = os.path.join("images", "venderslogo.jpeg")  # Ensure correct path
-    logo_base64 = get_base64_image(logo_path)
+    logo_html = picture_html(logo_path, "logo", "Vendor Logo")
 
-    if logo_base64:
+    if logo_html:
         st.markdown(f"""
-            <style>
-                .vendor-header {{
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 15px;
-                    background-color: rgb(5, 1, 1);
-                    padding: 15px;
-                    border-radius: 10px;
-                    box-shadow: 0px 2px 5px rgba(252, 252, 252, 0.86);
-                }}
-                .vendor-header img {{
-                    height: 60px;
-                    width: auto;
-                    border-radius: 5px;
-                }}
-                .vendor-header h1 {{
-                    color: white;
-                    font-size: 26px;
-                    font-weight: bold;
-                    margin: 0;
-                }}
-            </style>
-            <div class="vendor-header">
-                <img src="data:image/jpeg;base64,{logo_base64}" alt="Vendor Logo">
+            <div class="page-header">
+                {logo_html}
                 <h1>Vendor Dashboard</h1>
             </div>
         """, unsafe_allow_html=True)
     else:
         st.title("📦 Vendor Dashboard")  # Fallback if logo is missing
 
-# ✅ About Us Page Function
-def about_us_page():
-    # ✅ Set Background Image
-    set_background("images/venback.jpeg")  # ✅ Updated image
-
-# ✅ Connect to SQLite Database
+# ✅ Borrow a Pooled SQLite Connection (schema is set up once per process, not per rerun)
 def get_db_connection():
-    conn = sqlite3.connect("vendor.db")
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vendor (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password TEXT NOT NULL
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vendor_items (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            vendor_id INTEGER NOT NULL,
-            item_name TEXT NOT NULL,
-            item_price REAL NOT NULL,
-            FOREIGN KEY (vendor_id) REFERENCES vendor(id) ON DELETE CASCADE
-        )
-    """)
-    
-    conn.commit()
-    return conn
+    return db.get_pool().connection()
 
 # ✅ Vendor Page
 def vendor_page():
-    # ✅ Set Background Image
-    set_background("images/flas.jpg")  # ✅ Updated background image
-
     # ✅ Display Header with Logo
     header_with_logo()
     st.markdown("")
     st.markdown("🔹 Manage your products, track sales, and grow your business!")
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    try:
+        vendor_accounts()
+        with get_db_connection() as conn:  # ✅ Returned to the pool even when the page reruns early
+            vendor_dashboard(conn)
+    except TimeoutError:  # ✅ Hasher queue or connection pool exhausted
+        st.error("⏳ We're busy right now. Please try again in a moment.")
 
-    if "vendor_logged_in" not in st.session_state:
-        st.session_state.vendor_logged_in = False
-    if "vendor_username" not in st.session_state:
-        st.session_state.vendor_username = ""
+# ✅ Registration and Login. Passwords are hashed before a connection is borrowed, so a
+#    slow hash never holds one of the pool's connections.
+def vendor_accounts():
+    hasher = auth.get_password_hasher()  # ✅ Hashing runs on a bounded pool, off the script thread
 
     # ✅ Vendor Registration
     st.subheader("📝 Vendor Registration")
@@ -123,10 +75,11 @@ def vendor_page():
     new_password = st.text_input("Choose a Password", type="password")
     if st.button("Register"):
         if new_username and new_password:
+            stored = hasher.hash(new_password)
             try:
-                cursor.execute("INSERT INTO vendor (username, password) VALUES (?, ?)", 
-                               (new_username, new_password))
-                conn.commit()
+                with get_db_connection() as conn:
+                    conn.execute(REGISTER_VENDOR, (new_username, stored))
+                    conn.commit()
                 st.success("✅ Account registered successfully! You can now log in.")
             except sqlite3.IntegrityError:
                 st.error("❌ Username already exists. Choose a different one.")
@@ -138,42 +91,104 @@ def vendor_page():
     username = st.text_input("Username")
     password = st.text_input("Password", type="password")
     if st.button("Login"):
-        cursor.execute("SELECT id FROM vendor WHERE username=? AND password=?", 
-                       (username, password))
-        user = cursor.fetchone()
-        if user:
-            st.session_state.vendor_logged_in = True
-            st.session_state.vendor_username = username
-            st.session_state.vendor_id = user[0]
+        with get_db_connection() as conn:
+            user = conn.execute(LOGIN_VENDOR, (username,)).fetchone()
+        matches, needs_rehash = hasher.verify(password, user[1] if user else None)
+        if matches:
+            if needs_rehash:  # ✅ Upgrade plaintext (or weaker) passwords on their next login
+                try:
+                    stored = hasher.hash(password)
+                    with get_db_connection() as conn:
+                        conn.execute(UPDATE_PASSWORD, (stored, user[0]))
+                        conn.commit()
+                except TimeoutError:
+                    pass  # Busy - the login stands, the upgrade waits for the next one
+            st.session_state.vendor_token = auth.issue_token(user[0], username)  # ✅ Signed, checked in O(1)
             st.success(f"✅ Welcome, {username}!")
             st.rerun()
         else:
             st.error("❌ Invalid credentials. Please try again.")
 
+# ✅ Item Management and Sales
+def vendor_dashboard(conn):
+    cursor = conn.cursor()
+
     # ✅ Vendor Dashboard (after login)
-    if st.session_state.vendor_logged_in:
-        st.success(f"🔓 Logged in as **{st.session_state.vendor_username}**")
+    vendor = auth.current_vendor()
+    if vendor:
+        vendor_id, vendor_username = vendor
+        st.success(f"🔓 Logged in as **{vendor_username}**")
 
         # 🔹 Add New Item
         st.subheader("🛒 Add New Item")
         item_name = st.text_input("Item Name")
         item_price = st.number_input("Price ($)", min_value=1.0, step=0.5)
+        menu_categories = [VENDOR_CATEGORY, *(c for c in load_catalog().categories if c != VENDOR_CATEGORY)]
+        item_category = st.selectbox("Menu Category", menu_categories)
+        item_description = st.text_area("Description (shown on the menu)", max_chars=500)
 
         if st.button("➕ Add Item"):
             if item_name:
-                cursor.execute("INSERT INTO vendor_items (vendor_id, item_name, item_price) VALUES (?, ?, ?)",
-                               (st.session_state.vendor_id, item_name, item_price))
+                cursor.execute(ADD_ITEM, (vendor_id, item_name, item_price, item_category, item_description.strip()))
                 conn.commit()
                 st.success(f"✅ Item '{item_name}' added successfully!")
                 st.rerun()
             else:
                 st.warning("⚠️ Please enter an item name.")
 
-        # 🔹 Display Existing Items
+        # 🔹 Bulk Import / Export (streamed in chunks, one transaction per import)
+        with st.expander("📦 Bulk Import / Export"):
+            st.caption("CSV columns: item_name, item_price" + (" - Parquet files work too." if vendor_io.pq else ""))
+            upload = st.file_uploader(
+                "Upload items", type=["csv", "parquet"] if vendor_io.pq else ["csv"], key="bulk_upload"
+            )
+            if upload is not None and st.button("📥 Import Items"):
+                try:
+                    if upload.name.lower().endswith(".parquet"):
+                        rows = vendor_io.read_parquet_rows(upload)
+                    else:
+                        rows = vendor_io.read_csv_rows(upload)
+                    result = vendor_io.import_items(conn, vendor_id, rows)
+                except (ValueError, csv.Error) as error:
+                    st.error(f"❌ Could not import {upload.name}: {error}")
+                else:
+                    st.success(f"✅ Imported {result.imported:,} items.")
+                    if result.error_count:
+                        st.warning(f"⚠️ Skipped {result.error_count:,} invalid rows.")
+                        st.dataframe(
+                            [{"Line": line, "Problem": message} for line, message in result.errors],
+                            hide_index=True,
+                        )
+
+            def export_items():  # ✅ Runs only when clicked, on its own pooled connection
+                with get_db_connection() as export_conn:
+                    return vendor_io.export_file(export_conn, vendor_id)
+
+            st.download_button("📤 Export Items (CSV)", export_items, file_name="items.csv", mime="text/csv")
+
+        # 🔹 Display Existing Items (one page at a time, optionally filtered by name)
         st.subheader("📋 Manage Your Items")
-        cursor.execute("SELECT id, item_name, item_price FROM vendor_items WHERE vendor_id=?", 
-                       (st.session_state.vendor_id,))
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            name_filter = st.text_input("🔍 Filter by name").strip()
+        with col2:
+            page_size = st.selectbox("Items per page", PAGE_SIZES, index=1)
+
+        # ✅ Start ids of the pages before this one; reset when the filter or page size changes
+        if st.session_state.get("items_query") != (vendor_id, name_filter, page_size):
+            st.session_state.items_query = (vendor_id, name_filter, page_size)
+            st.session_state.items_pages = []
+        pages = st.session_state.items_pages
+        after_id = pages[-1] if pages else 0
+
+        if name_filter:
+            pattern = "%" + name_filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            cursor.execute(FIND_ITEMS, (vendor_id, after_id, pattern, page_size + 1))
+        else:
+            cursor.execute(LIST_ITEMS, (vendor_id, after_id, page_size + 1))
         items = cursor.fetchall()
+        has_next = len(items) > page_size
+        items = items[:page_size]
 
         if items:
             for item in items:
@@ -182,30 +197,71 @@ def vendor_page():
                     st.write(f"🍽️ **{item[1]}** - 💲{item[2]:.2f}")
                 with col2:
                     if st.button(f"❌ Remove {item[1]}", key=item[0]):
-                        cursor.execute("DELETE FROM vendor_items WHERE id=?", (item[0],))
+                        cursor.execute(REMOVE_ITEM, (item[0],))
                         conn.commit()
                         st.success(f"🚫 {item[1]} removed successfully!")
                         st.rerun()
+        elif name_filter:
+            st.info(f"⚠️ No items match '{name_filter}'.")
         else:
             st.info("⚠️ No items added yet.")
 
-        # 🔹 Vendor Analytics
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if pages and st.button("◀ Previous"):
+                pages.pop()
+                st.rerun()
+        with col2:
+            if pages or has_next:
+                st.caption(f"Page {len(pages) + 1}")
+        with col3:
+            if has_next and st.button("Next ▶"):
+                pages.append(items[-1][0])
+                st.rerun()
+
+        # 🔹 Vendor Analytics (menu totals from a covering index; sales from the hourly/daily
+        #    rollups the order writer keeps, so this costs the same for any order history)
         st.subheader("📊 Sales Summary")
+        item_count, total_value = cursor.execute(ITEM_SUMMARY, (vendor_id,)).fetchone()
         col1, col2 = st.columns(2)
         with col1:
-            st.metric(label="Total Items Listed", value=len(items))
+            st.metric(label="Total Items Listed", value=item_count)
         with col2:
-            total_value = sum(item[2] for item in items)
             st.metric(label="Total Inventory Value", value=f"${total_value:.2f}")
 
+        window = st.radio("Sales window", list(analytics.WINDOWS), horizontal=True, key="sales_window")
+        series = analytics.sales_series(conn, vendor_id, window)
+        orders, units, revenue_cents = analytics.sales_totals(series)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric(label="Revenue", value=f"${revenue_cents / 100:,.2f}")
+        with col2:
+            st.metric(label="Units Sold", value=f"{units:,}")
+        with col3:
+            st.metric(label="Orders", value=f"{orders:,}")
+        if orders:
+            st.bar_chart(
+                pd.DataFrame(
+                    {"Revenue ($)": [bucket.revenue_cents / 100 for bucket in series]},
+                    # ✅ Timestamps, not labels - a temporal axis stays in time order across midnight / month ends
+                    index=pd.to_datetime([bucket.start for bucket in series], unit="s", utc=True),
+                ),
+                x_label="UTC", y_label="Revenue ($)",
+            )
+            st.markdown("**🏆 Top Items**")
+            st.dataframe(
+                [{"Item": item.name, "Units": item.units, "Revenue": f"${item.revenue_cents / 100:,.2f}"}
+                 for item in analytics.top_items(conn, vendor_id, window)],
+                hide_index=True,
+            )
+        else:
+            st.info("No sales in this window yet.")
+
         # 🔹 Logout
         if st.button("🚪 Logout"):
-            st.session_state.vendor_logged_in = False
-            st.session_state.vendor_username = ""
+            st.session_state.pop("vendor_token", None)
             st.rerun()
 
-    conn.close()
-
 # ✅ Run the Page
 if __name__ == "__main__":
     vendor_page()